@@ -1,24 +1,18 @@
 """Example of using the Bedrock Knowledge Base query tool with the agent."""
 
-import sys
-from pathlib import Path
-
-# Add parent directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
-from dotenv import load_dotenv
+import asyncio
 
 from agent_poc.config.settings import get_settings
-from agent_poc.openai_client import create_openai_model
-from agent_poc.bedrock_client import create_bedrock_model
 from agent_poc.agent import StrandsAgent
-from agent_poc.tools import query_bedrock_knowledge_base, get_current_time
+from agent_poc.providers import create_model
+from agent_poc.tools import make_query_kb_tool, get_current_time
 
+HEADER = "=" * 60
+RULE = "-" * 60
 
-def main():
+
+async def main():
     """Example of agent querying a Bedrock Knowledge Base."""
-    # Load environment variables
-    load_dotenv()
     settings = get_settings()
     
     # Check if KB is configured
@@ -28,39 +22,35 @@ def main():
         print("Example: BEDROCK_KB_ID=ABCD1234EFGH")
         return
     
-    print("="*60)
+    print(HEADER)
     print("Bedrock Knowledge Base Query Example")
-    print("="*60)
+    print(HEADER)
     print(f"Knowledge Base ID: {settings.bedrock_kb.bedrock_kb_id}")
     print(f"Region: {settings.bedrock_kb.bedrock_kb_region}")
     print(f"Provider: {settings.agent.agent_provider}")
-    print("="*60)
+    print(HEADER)
     print()
     
     # Create model based on provider
-    if settings.agent.agent_provider == "openai":
-        print("Creating OpenAI model...")
-        model = create_openai_model(settings.openai)
-    else:
-        print("Creating Bedrock model...")
-        model = create_bedrock_model(settings.aws, settings.bedrock)
+    print(f"Creating {settings.agent.agent_provider} model...")
+    model = create_model(settings)
     
-    # Initialize agent with KB query tool
-    print("Initializing agent with Knowledge Base query tool...")
-    agent = StrandsAgent(
-        model=model,
-        config=settings.agent,
-        tools=[query_bedrock_knowledge_base, get_current_time],
-        system_prompt=(
-            "You are a helpful AI assistant with access to a knowledge base. "
-            "When users ask questions, use the query_bedrock_knowledge_base tool to search for relevant information. "
-            "Always cite the sources when providing information from the knowledge base. "
-            "Be concise but thorough in your responses."
-        )
-    )
+    # Bind the KB tool to these settings once; all agents share it
+    query_bedrock_knowledge_base = make_query_kb_tool(settings)
     
-    print("✓ Agent initialized successfully!")
-    print()
+    def create_agent():
+        # One agent per query: a Strands Agent handles one invocation at a time
+        return StrandsAgent(
+            model=model,
+            config=settings.agent,
+            tools=[query_bedrock_knowledge_base, get_current_time],
+            system_prompt=(
+                "You are a helpful AI assistant with access to a knowledge base. "
+                "When users ask questions, use the query_bedrock_knowledge_base tool to search for relevant information. "
+                "Always cite the sources when providing information from the knowledge base. "
+                "Be concise but thorough in your responses."
+            )
+        )
     
     # Example queries
     queries = [
@@ -69,34 +59,42 @@ def main():
         "Search for information about pricing plans"
     ]
     
-    for i, query in enumerate(queries, 1):
-        print("\n" + "="*60)
+    # Initialize agents with KB query tool
+    print("Initializing agents with Knowledge Base query tool...")
+    agents = [create_agent() for _ in queries]
+    
+    print("✓ Agents initialized successfully!")
+    print()
+    
+    # The queries are independent, so overlap their model round-trips
+    results = await asyncio.gather(
+        *(agent.arun(query) for agent, query in zip(agents, queries)),
+        return_exceptions=True
+    )
+    
+    for i, (query, result) in enumerate(zip(queries, results), 1):
+        print("\n" + HEADER)
         print(f"Example {i}: Knowledge Base Query")
-        print("="*60)
+        print(HEADER)
         print(f"Query: {query}")
         print()
         print("Agent Response:")
-        print("-"*60)
-        
-        try:
-            response = agent.run(query)
-            print(response)
-        except Exception as e:
-            print(f"Error: {e}")
+        print(RULE)
         
-        print("-"*60)
+        if isinstance(result, Exception):
+            print(f"Error: {result}")
+        else:
+            print(result)
         
-        # Only run first query if in demo mode
-        if i == 1:
-            print()
-            print("💡 Tip: Modify the queries list to test with your actual knowledge base content")
-            break
+        print(RULE)
     
     print()
-    print("="*60)
+    print("💡 Tip: Modify the queries list to test with your actual knowledge base content")
+    print()
+    print(HEADER)
     print("Knowledge Base query examples completed!")
-    print("="*60)
+    print(HEADER)
 
 
 if __name__ == "__main__":
-    main()
+    asyncio.run(main())
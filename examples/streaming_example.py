@@ -1,22 +1,23 @@
 """Example of streaming responses from the Strands agent."""
 
 import sys
-from pathlib import Path
-
-# Add parent directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
-from dotenv import load_dotenv
+import time
 
 from agent_poc.config.settings import get_settings
 from agent_poc.bedrock_client import create_bedrock_model
 from agent_poc.agent import StrandsAgent
 
+HEADER = "=" * 60
+RULE = "-" * 60
+
+# Streamed output is flushed every FLUSH_INTERVAL seconds or once more than
+# FLUSH_CHARS characters are buffered, whichever comes first
+FLUSH_INTERVAL = 0.05
+FLUSH_CHARS = 64
+
 
 def main():
     """Streaming response example."""
-    # Load environment variables
-    load_dotenv()
     settings = get_settings()
     
     # Create Bedrock model
@@ -32,27 +33,40 @@ def main():
     )
     
     # Example: Streaming a story
-    print("\n" + "="*60)
+    print("\n" + HEADER)
     print("Streaming Example: Generate a Short Story")
-    print("="*60)
+    print(HEADER)
     query = "Tell me a very short story about a robot learning to paint."
     print(f"Query: {query}\n")
     print("Response (streaming):")
-    print("-" * 60)
+    print(RULE)
     
     try:
+        # Coalesce chunks instead of writing and flushing every token
+        buffer = []
+        buffered_chars = 0
+        next_flush = time.monotonic() + FLUSH_INTERVAL
         for chunk in agent.run_streaming(query):
-            print(chunk, end="", flush=True)
+            buffer.append(chunk)
+            buffered_chars += len(chunk)
+            if buffered_chars > FLUSH_CHARS or time.monotonic() >= next_flush:
+                sys.stdout.write("".join(buffer))
+                sys.stdout.flush()
+                buffer.clear()
+                buffered_chars = 0
+                next_flush = time.monotonic() + FLUSH_INTERVAL
+        sys.stdout.write("".join(buffer))
+        sys.stdout.flush()
     except Exception as e:
         print(f"\nNote: Streaming may not be fully supported depending on the model.")
         print(f"Error: {e}")
         print("\nFalling back to regular response:")
         print(agent.run(query))
     
-    print("\n" + "-" * 60)
-    print("\n" + "="*60)
+    print("\n" + RULE)
+    print("\n" + HEADER)
     print("Streaming example completed!")
-    print("="*60)
+    print(HEADER)
 
 
 if __name__ == "__main__":
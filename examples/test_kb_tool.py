@@ -1,26 +1,18 @@
 """Test the Bedrock Knowledge Base tool directly without the agent."""
 
-import sys
-from pathlib import Path
-
-# Add parent directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
-from dotenv import load_dotenv
-
 from agent_poc.config.settings import get_settings
-from agent_poc.tools import query_bedrock_knowledge_base
+from agent_poc.tools import make_query_kb_tool
+
+HEADER = "=" * 60
 
 
 def main():
     """Test the KB query tool directly."""
-    # Load environment variables
-    load_dotenv()
     settings = get_settings()
     
-    print("="*60)
+    print(HEADER)
     print("Bedrock Knowledge Base Tool Test")
-    print("="*60)
+    print(HEADER)
     
     # Check configuration
     if not settings.bedrock_kb.bedrock_kb_id:
@@ -55,14 +47,15 @@ def main():
     
     print()
     print(f"Querying knowledge base with: '{test_query}'")
-    print("="*60)
+    print(HEADER)
     print()
     
     try:
+        query_bedrock_knowledge_base = make_query_kb_tool(settings)
         result = query_bedrock_knowledge_base(test_query, max_results=3)
         print(result)
         print()
-        print("="*60)
+        print(HEADER)
         print("✓ Test completed successfully!")
         
     except Exception as e:
@@ -1,15 +1,78 @@
 """Strands agent implementation using the official Strands library."""
 
+import asyncio
+import atexit
+import concurrent.futures
+import contextlib
 import logging
-from typing import Any, Callable, Generator, List, Optional, Sequence, Union
+import os
+import queue
+from typing import TYPE_CHECKING, Any, Callable, Dict, Generator, List, Optional, Sequence, Tuple, Union
 
 from strands import Agent
 from strands.models import BedrockModel, Model
+from strands.tools.executors import ConcurrentToolExecutor, SequentialToolExecutor
 
+from agent_poc.cache import ResponseCache, make_cache_key
 from agent_poc.config.settings import AgentConfig
 
+if TYPE_CHECKING:
+    from strands.tools.executors._executor import ToolExecutor
+
 logger: logging.Logger = logging.getLogger(__name__)
 
+# Responses are only cached when sampling is close to deterministic
+RESPONSE_CACHE_MAX_TEMPERATURE: float = 0.2
+
+# Process-wide pool for blocking agent I/O (arun calls and streaming pumps),
+# so concurrent requests reuse threads instead of spawning new ones
+_AGENT_EXECUTOR: concurrent.futures.ThreadPoolExecutor = concurrent.futures.ThreadPoolExecutor(
+    max_workers=min(32, (os.cpu_count() or 4) * 4),
+    thread_name_prefix="agent-io"
+)
+atexit.register(_AGENT_EXECUTOR.shutdown, wait=False)
+
+# Marks the end of a streamed response on the hand-off queue
+_STREAM_END: object = object()
+
+
+class _StreamError:
+    """Carries an exception raised while streaming back to the consuming thread."""
+    
+    def __init__(self, error: Exception) -> None:
+        self.error: Exception = error
+
+
+def _extract_text(response: Any) -> str:
+    """Extract the text of the first content block from an AgentResult.
+    
+    Args:
+        response: Result returned by the Strands Agent
+        
+    Returns:
+        Text of the response, or ``str(response)`` if it doesn't have the
+        usual AgentResult -> Message -> [ContentBlock] shape
+    """
+    try:
+        return str(response.message["content"][0]["text"])
+    except (AttributeError, IndexError, KeyError, TypeError):
+        return str(response)
+
+
+def _create_tool_executor(config: AgentConfig) -> "ToolExecutor":
+    """Create the Strands tool executor selected by the configuration.
+    
+    Args:
+        config: Agent configuration
+        
+    Returns:
+        A concurrent executor, which runs all tool calls the model requests in
+        a single turn in parallel, or a sequential one
+    """
+    if config.parallel_tool_calls:
+        return ConcurrentToolExecutor()
+    return SequentialToolExecutor()
+
 
 class StrandsAgent:
     """A wrapper around Strands Agent that supports multiple model providers.
@@ -55,10 +118,19 @@ class StrandsAgent:
             model=model,
             tools=list(tools) if tools else [],
             system_prompt=system_prompt or default_system_prompt,
-            name=config.agent_name
+            name=config.agent_name,
+            tool_executor=_create_tool_executor(config)
         )
         
-        logger.info(f"Initialized {config.agent_name} with Strands Agent framework using {model_provider}")
+        self._last_usage: Optional[Dict[str, int]] = None
+        self.response_cache: Optional[ResponseCache] = None
+        if config.enable_response_cache:
+            self.response_cache = ResponseCache(
+                config.response_cache_path,
+                ttl_seconds=config.response_cache_ttl_seconds
+            )
+        
+        logger.info("Initialized %s with Strands Agent framework using %s", config.agent_name, model_provider)
     
     def run(self, user_input: str, stream: bool = False) -> str:
         """Run the agent with a user input.
@@ -73,42 +145,94 @@ class StrandsAgent:
         Raises:
             Exception: If there's an error running the agent
         """
-        logger.info(f"Processing user input: {user_input[:50]}...")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Processing user input: %s...", user_input[:50])
+        
+        cache_key: Optional[str] = self._response_cache_key(user_input)
+        if cache_key is not None and self.response_cache is not None:
+            cached: Optional[str] = self.response_cache.get(cache_key)
+            if cached is not None:
+                logger.info("Response served from cache")
+                self._record_cached_turn(user_input, cached)
+                return cached
         
         try:
             # Call the agent directly (uses __call__ method)
             response: Any = self.agent(user_input)
             
-            # Extract the final message content from AgentResult
-            if hasattr(response, 'message'):
-                message: Any = response.message
-                if hasattr(message, 'content'):
-                    # Content is a list of ContentBlocks
-                    content_blocks: Any = message.content
-                    if isinstance(content_blocks, list) and len(content_blocks) > 0:
-                        # Get text from first content block
-                        first_block: Any = content_blocks[0]
-                        if hasattr(first_block, 'text'):
-                            agent_response: str = first_block.text
-                        else:
-                            agent_response = str(first_block)
-                    else:
-                        agent_response = str(content_blocks)
-                else:
-                    agent_response = str(message)
-            else:
-                agent_response = str(response)
+            agent_response: str = _extract_text(response)
             
             logger.info("Response generated successfully")
+            if cache_key is not None and self.response_cache is not None:
+                self.response_cache.set(cache_key, agent_response)
             return agent_response
             
         except Exception as e:
-            logger.error(f"Error running agent: {e}", exc_info=True)
+            logger.error("Error running agent: %s", e, exc_info=True)
             raise
     
+    async def arun(self, user_input: str) -> str:
+        """Run the agent without blocking the event loop.
+        
+        The blocking model call runs on the shared agent I/O pool, so several
+        agents can have requests in flight at once (e.g. via ``asyncio.gather``).
+        
+        Args:
+            user_input: User's input/query
+            
+        Returns:
+            Agent's response as a string
+        """
+        loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+        return await loop.run_in_executor(_AGENT_EXECUTOR, self.run, user_input)
+    
+    def _response_cache_key(self, user_input: str) -> Optional[str]:
+        """Compute the response cache key for a call, if it may be cached.
+        
+        Args:
+            user_input: User's input/query
+            
+        Returns:
+            Cache key, or None if caching is disabled or the model samples
+            at too high a temperature for responses to be reusable
+        """
+        if self.response_cache is None:
+            return None
+        
+        model_config: Dict[str, Any] = dict(self.model.get_config())
+        temperature: Optional[float] = model_config.get('temperature')
+        if temperature is None or temperature > RESPONSE_CACHE_MAX_TEMPERATURE:
+            return None
+        
+        return make_cache_key(
+            system_prompt=self.agent.system_prompt,
+            messages=self.conversation_history,
+            user_input=user_input,
+            model_id=model_config.get('model_id') or model_config.get('model'),
+            temperature=temperature
+        )
+    
+    def _record_cached_turn(self, user_input: str, response: str) -> None:
+        """Append a cache-served exchange to the history so follow-ups keep context.
+        
+        Args:
+            user_input: User's input/query
+            response: Cached agent response
+        """
+        messages: Any = getattr(self.agent, 'messages', None)
+        if isinstance(messages, list):
+            messages.append({'role': 'user', 'content': [{'text': user_input}]})
+            messages.append({'role': 'assistant', 'content': [{'text': response}]})
+    
     def run_streaming(self, user_input: str) -> Generator[str, None, None]:
         """Run the agent with streaming response.
         
+        The Strands ``stream_async`` iterator is driven on an event loop in the
+        shared agent I/O pool and text deltas are handed over through a queue, so chunks are
+        yielded as soon as the model produces them. If the caller stops iterating
+        early, the stream is cancelled before the generator returns so the agent
+        is free for the next request.
+        
         Args:
             user_input: User's input/query
             
@@ -118,35 +242,54 @@ class StrandsAgent:
         Raises:
             Exception: If there's an error in streaming
         """
-        logger.info(f"Processing user input with streaming: {user_input[:50]}...")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Processing user input with streaming: %s...", user_input[:50])
+        
+        chunks: "queue.Queue[Any]" = queue.Queue()
+        running: List[Tuple[asyncio.AbstractEventLoop, "asyncio.Task[Any]"]] = []
+        
+        self._last_usage = None
+        
+        async def pump() -> None:
+            task: Optional["asyncio.Task[Any]"] = asyncio.current_task()
+            if task is not None:
+                running.append((asyncio.get_running_loop(), task))
+            # Token usage arrives in the stream's metadata events (one per model
+            # call in the turn), so no separate usage lookup is needed
+            usage: Dict[str, int] = {"inputTokens": 0, "outputTokens": 0}
+            seen_usage: bool = False
+            try:
+                async for event in self.agent.stream_async(user_input):
+                    if "data" in event:
+                        chunks.put(event["data"])
+                    elif "event" in event and "metadata" in event["event"]:
+                        event_usage: Dict[str, int] = event["event"]["metadata"].get("usage", {})
+                        usage["inputTokens"] += event_usage.get("inputTokens", 0)
+                        usage["outputTokens"] += event_usage.get("outputTokens", 0)
+                        seen_usage = True
+                if seen_usage:
+                    self._last_usage = usage
+            except Exception as e:
+                chunks.put(_StreamError(e))
+            finally:
+                chunks.put(_STREAM_END)
+        
+        future: "concurrent.futures.Future[None]" = _AGENT_EXECUTOR.submit(asyncio.run, pump())
         
         try:
-            # Use Strands Agent stream_async for streaming
-            # Note: For sync usage, we'll need to adapt the async streaming
-            response: Any = self.agent(user_input)
-            
-            # For now, return the full response
-            # TODO: Implement proper streaming with stream_async
-            if hasattr(response, 'message'):
-                message: Any = response.message
-                if hasattr(message, 'content'):
-                    content_blocks: Any = message.content
-                    if isinstance(content_blocks, list) and len(content_blocks) > 0:
-                        first_block: Any = content_blocks[0]
-                        if hasattr(first_block, 'text'):
-                            yield first_block.text
-                        else:
-                            yield str(first_block)
-                    else:
-                        yield str(content_blocks)
-                else:
-                    yield str(message)
-            else:
-                yield str(response)
-                    
-        except Exception as e:
-            logger.error(f"Error in streaming: {e}", exc_info=True)
-            raise
+            for chunk in iter(chunks.get, _STREAM_END):
+                if isinstance(chunk, _StreamError):
+                    logger.error("Error in streaming: %s", chunk.error, exc_info=chunk.error)
+                    raise chunk.error
+                yield chunk
+        finally:
+            if not future.done() and running:
+                loop, task = running[0]
+                # The loop is closed if the pump finished in the meantime
+                with contextlib.suppress(RuntimeError):
+                    loop.call_soon_threadsafe(task.cancel)
+            # Wait for the agent to release its invocation before returning
+            concurrent.futures.wait([future])
     
     def add_tool(self, tool: Callable[..., Any]) -> None:
         """Add a tool to the agent.
@@ -156,20 +299,47 @@ class StrandsAgent:
         """
         tools_list: List[Any] = getattr(self.agent, 'tools', [])
         tools_list.append(tool)
-        logger.info(f"Added tool to agent: {tool}")
+        logger.info("Added tool to agent: %s", tool)
     
     def reset_conversation(self) -> None:
         """Reset the agent's conversation history."""
-        # Create a new agent instance to reset state
+        messages: Any = getattr(self.agent, 'messages', None)
+        if isinstance(messages, list):
+            # Clear the history in place rather than rebuilding the agent
+            messages.clear()
+            logger.info("Agent conversation reset")
+            return
+        
+        # Fall back to creating a new agent instance to reset state
         tools_list: List[Any] = getattr(self.agent, 'tools', [])
         self.agent = Agent(
             model=self.model,
             tools=tools_list,
             system_prompt=self.agent.system_prompt,
-            name=self.config.agent_name
+            name=self.config.agent_name,
+            tool_executor=_create_tool_executor(self.config)
         )
         logger.info("Agent conversation reset")
     
+    @property
+    def last_usage(self) -> Optional[Dict[str, int]]:
+        """Get the token usage of the last streamed response.
+        
+        Returns:
+            Dict with ``prompt_tokens``, ``completion_tokens`` and ``total_tokens``
+            for the most recent ``run_streaming`` call, or None if the model
+            reported no usage
+        """
+        if self._last_usage is None:
+            return None
+        prompt_tokens: int = self._last_usage["inputTokens"]
+        completion_tokens: int = self._last_usage["outputTokens"]
+        return {
+            "prompt_tokens": prompt_tokens,
+            "completion_tokens": completion_tokens,
+            "total_tokens": prompt_tokens + completion_tokens,
+        }
+    
     @property
     def conversation_history(self) -> List[Any]:
         """Get the conversation history from the agent.
@@ -1,21 +1,89 @@
 """AWS Bedrock model wrapper for Strands Agents."""
 
+import functools
 import logging
-from typing import Any, Dict, Optional
-
-import boto3
-from boto3.session import Session
-
-from strands.models import BedrockModel
+from typing import TYPE_CHECKING, Any, Dict, FrozenSet, Optional, Tuple
 
 from agent_poc.config.settings import AWSConfig, BedrockConfig
 
+if TYPE_CHECKING:
+    from boto3.session import Session
+    from strands.models import BedrockModel
+
 logger: logging.Logger = logging.getLogger(__name__)
 
+# Regions where Bedrock documents performanceConfig={"latency": "optimized"}, per
+# model. Requests for any other model/region pair are rejected with a
+# ValidationException, so the field is only sent for a listed pair.
+LATENCY_OPTIMIZED_MODELS: Dict[str, FrozenSet[str]] = {
+    "anthropic.claude-3-5-haiku": frozenset({"us-east-2", "us-west-2"}),
+    "meta.llama3-1-70b": frozenset({"us-east-2", "us-west-2"}),
+    "meta.llama3-1-405b": frozenset({"us-east-2"}),
+}
+
+# Models that accept cachePoint blocks for prompt caching
+PROMPT_CACHE_MODELS: Tuple[str, ...] = (
+    "anthropic.claude-3-5-",
+    "anthropic.claude-3-7-",
+    "anthropic.claude-sonnet-4",
+    "anthropic.claude-opus-4",
+    "anthropic.claude-haiku-4",
+)
+
+
+def supports_latency_optimized(model_id: str, region: str) -> bool:
+    """Check whether latency-optimized inference is available for a model.
+    
+    Args:
+        model_id: Bedrock model ID or inference profile ID
+        region: AWS region the model is invoked in
+        
+    Returns:
+        True if the model/region combination supports latency-optimized inference
+    """
+    return any(
+        prefix in model_id and region in regions
+        for prefix, regions in LATENCY_OPTIMIZED_MODELS.items()
+    )
+
+
+def supports_prompt_cache(model_id: str) -> bool:
+    """Check whether Bedrock prompt caching is available for a model.
+    
+    Args:
+        model_id: Bedrock model ID or inference profile ID
+        
+    Returns:
+        True if the model accepts cachePoint blocks
+    """
+    return any(prefix in model_id for prefix in PROMPT_CACHE_MODELS)
+
 
-def create_bedrock_model(aws_config: AWSConfig, bedrock_config: BedrockConfig) -> BedrockModel:
+def _prompt_cache_kwargs() -> Dict[str, Any]:
+    """BedrockModel options that cache the system prompt on the installed SDK.
+    
+    Newer strands-agents releases configure caching through ``cache_config``
+    and warn on every request that still uses ``cache_prompt``; releases
+    without ``CacheConfig`` only understand ``cache_prompt``.
+    
+    Returns:
+        Keyword arguments to pass to BedrockModel
+    """
+    try:
+        from strands.models import CacheConfig
+    except ImportError:
+        return {"cache_prompt": "default"}
+    # Places cachePoint blocks after the system prompt and the latest user turn,
+    # so the static prefix and the conversation so far are reused across calls
+    return {"cache_config": CacheConfig(strategy="auto")}
+
+
+def create_bedrock_model(aws_config: AWSConfig, bedrock_config: BedrockConfig) -> "BedrockModel":
     """Create a Strands BedrockModel instance.
     
+    Models are cached per configuration, so repeated calls with the same
+    settings reuse the boto3 session and BedrockModel instead of rebuilding them.
+    
     Args:
         aws_config: AWS configuration
         bedrock_config: Bedrock-specific configuration
@@ -26,29 +94,71 @@ def create_bedrock_model(aws_config: AWSConfig, bedrock_config: BedrockConfig) -
     Raises:
         Exception: If there's an error creating the Bedrock model
     """
+    # Settings objects are not hashable, so key the cache on their fields
+    return _build_bedrock_model(
+        aws_config.aws_region,
+        aws_config.aws_access_key_id,
+        aws_config.aws_secret_access_key,
+        aws_config.aws_session_token,
+        bedrock_config.bedrock_model_id,
+        bedrock_config.bedrock_temperature,
+        bedrock_config.bedrock_max_tokens,
+        bedrock_config.bedrock_latency_optimized,
+        bedrock_config.bedrock_enable_prompt_cache,
+    )
+
+
+@functools.lru_cache(maxsize=8)
+def _build_bedrock_model(
+    aws_region: str,
+    aws_access_key_id: Optional[str],
+    aws_secret_access_key: Optional[str],
+    aws_session_token: Optional[str],
+    model_id: str,
+    temperature: float,
+    max_tokens: int,
+    latency_optimized: bool,
+    enable_prompt_cache: bool,
+) -> "BedrockModel":
+    """Build a BedrockModel from primitive settings (cached)."""
+    # Imported here so callers that never build a Bedrock model skip boto3
+    import boto3
+    from strands.models import BedrockModel
+    
     # Create boto3 session with credentials if provided
     session_kwargs: Dict[str, Optional[str]] = {
-        "region_name": aws_config.aws_region
+        "region_name": aws_region
     }
     
-    if aws_config.aws_access_key_id:
-        session_kwargs["aws_access_key_id"] = aws_config.aws_access_key_id
-    if aws_config.aws_secret_access_key:
-        session_kwargs["aws_secret_access_key"] = aws_config.aws_secret_access_key
-    if aws_config.aws_session_token:
-        session_kwargs["aws_session_token"] = aws_config.aws_session_token
+    if aws_access_key_id:
+        session_kwargs["aws_access_key_id"] = aws_access_key_id
+    if aws_secret_access_key:
+        session_kwargs["aws_secret_access_key"] = aws_secret_access_key
+    if aws_session_token:
+        session_kwargs["aws_session_token"] = aws_session_token
     
-    boto_session: Session = boto3.Session(**session_kwargs)  # type: ignore
+    boto_session: "Session" = boto3.Session(**session_kwargs)  # type: ignore
     
-    logger.info(f"Creating BedrockModel with model_id: {bedrock_config.bedrock_model_id}")
-    logger.info(f"Region: {aws_config.aws_region}")
+    logger.info("Creating BedrockModel with model_id: %s", model_id)
+    logger.info("Region: %s", aws_region)
+    
+    model_kwargs: Dict[str, Any] = {
+        "model_id": model_id,
+        "boto_session": boto_session,
+        "temperature": temperature,
+        "max_tokens": max_tokens,
+    }
+    
+    # performanceConfig is a top-level Converse parameter, so it goes in additional_args
+    if latency_optimized and supports_latency_optimized(model_id, aws_region):
+        logger.info("Latency-optimized inference enabled")
+        model_kwargs["additional_args"] = {"performanceConfig": {"latency": "optimized"}}
+    
+    if enable_prompt_cache and supports_prompt_cache(model_id):
+        logger.info("Prompt caching enabled")
+        model_kwargs.update(_prompt_cache_kwargs())
     
     # Create Strands BedrockModel
-    model: BedrockModel = BedrockModel(
-        model_id=bedrock_config.bedrock_model_id,
-        boto_session=boto_session,
-        temperature=bedrock_config.bedrock_temperature,
-        max_tokens=bedrock_config.bedrock_max_tokens
-    )
+    model: BedrockModel = BedrockModel(**model_kwargs)
     
     return model
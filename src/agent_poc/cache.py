@@ -0,0 +1,114 @@
+"""Persistent response cache for agent calls.
+
+Responses are stored in a small SQLite database keyed by a hash of everything
+that determines the model output (system prompt, history, input, model and
+temperature), so repeated deterministic queries skip the model round-trip.
+"""
+
+import hashlib
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, List, Optional
+
+import orjson
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+
+def make_cache_key(
+    system_prompt: Optional[str],
+    messages: List[Any],
+    user_input: str,
+    model_id: Optional[str],
+    temperature: Optional[float]
+) -> str:
+    """Build a cache key for an agent call.
+
+    Args:
+        system_prompt: System prompt the agent was created with
+        messages: Conversation history before this call
+        user_input: User's input/query
+        model_id: Identifier of the model answering the call
+        temperature: Sampling temperature of the model
+
+    Returns:
+        Hex digest identifying the call
+    """
+    payload: bytes = orjson.dumps(
+        {
+            "sys": system_prompt,
+            "msgs": messages,
+            "in": user_input,
+            "model": model_id,
+            "temp": temperature,
+        },
+        default=str,
+        option=orjson.OPT_SORT_KEYS,
+    )
+    # Any stdlib hash turns a 1-10 KB payload into a key in microseconds. Keeping
+    # a fixed stdlib one avoids a compiled dependency such as BLAKE3, and keeps
+    # persisted keys independent of which packages are installed
+    return hashlib.blake2b(payload).hexdigest()
+
+
+class ResponseCache:
+    """SQLite-backed cache of agent responses with a time-to-live."""
+
+    def __init__(self, path: str, ttl_seconds: float = 86400) -> None:
+        """Open (or create) the cache database.
+
+        Args:
+            path: Path to the SQLite database file
+            ttl_seconds: How long entries stay valid, in seconds
+        """
+        self.ttl_seconds: float = ttl_seconds
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._lock: threading.Lock = threading.Lock()
+        self._conn: sqlite3.Connection = sqlite3.connect(path, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses "
+                "(key TEXT PRIMARY KEY, response TEXT NOT NULL, created_at REAL NOT NULL)"
+            )
+        logger.debug("Opened response cache at %s", path)
+
+    def get(self, key: str) -> Optional[str]:
+        """Look up a cached response.
+
+        Args:
+            key: Cache key from make_cache_key
+
+        Returns:
+            The cached response, or None if missing or expired
+        """
+        with self._lock:
+            row: Any = self._conn.execute(
+                "SELECT response, created_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+        if row is None:
+            return None
+        response, created_at = row
+        if time.time() - created_at > self.ttl_seconds:
+            return None
+        return str(response)
+
+    def set(self, key: str, response: str) -> None:
+        """Store a response.
+
+        Args:
+            key: Cache key from make_cache_key
+            response: Agent response to cache
+        """
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, response, created_at) VALUES (?, ?, ?)",
+                (key, response, time.time()),
+            )
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        with self._lock:
+            self._conn.close()
@@ -1,12 +1,20 @@
 """Application settings using pydantic-settings."""
 
+import functools
+
+from dotenv import load_dotenv
+from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+# No env_file here: get_settings() loads .env into the environment once and every
+# class reads it from there, instead of each one re-parsing the file
+_SETTINGS_CONFIG: SettingsConfigDict = SettingsConfigDict(extra="ignore")
+
 
 class AWSConfig(BaseSettings):
     """AWS configuration settings."""
     
-    model_config = SettingsConfigDict(env_file="../../.env", extra="ignore")
+    model_config = _SETTINGS_CONFIG
     
     aws_region: str = "us-east-1"
     aws_access_key_id: str | None = None
@@ -17,17 +25,19 @@ class AWSConfig(BaseSettings):
 class BedrockConfig(BaseSettings):
     """AWS Bedrock configuration settings."""
     
-    model_config = SettingsConfigDict(env_file="../../.env", extra="ignore")
+    model_config = _SETTINGS_CONFIG
     
     bedrock_model_id: str = "anthropic.claude-3-sonnet-20240229-v1:0"
     bedrock_max_tokens: int = 4096
     bedrock_temperature: float = 0.7
+    bedrock_latency_optimized: bool = True
+    bedrock_enable_prompt_cache: bool = True
 
 
 class BedrockKnowledgeBaseConfig(BaseSettings):
     """AWS Bedrock Knowledge Base configuration settings."""
     
-    model_config = SettingsConfigDict(env_file="../../.env", extra="ignore")
+    model_config = _SETTINGS_CONFIG
     
     bedrock_kb_id: str | None = None
     bedrock_kb_region: str = "us-east-1"
@@ -36,7 +46,7 @@ class BedrockKnowledgeBaseConfig(BaseSettings):
 class OpenAIConfig(BaseSettings):
     """OpenAI configuration settings."""
     
-    model_config = SettingsConfigDict(env_file="../../.env", extra="ignore")
+    model_config = _SETTINGS_CONFIG
     
     openai_api_key: str | None = None
     openai_model: str = "gpt-4o"  # Latest GPT-4 model, can be changed to gpt-5 when available
@@ -47,25 +57,37 @@ class OpenAIConfig(BaseSettings):
 class AgentConfig(BaseSettings):
     """Agent configuration settings."""
     
-    model_config = SettingsConfigDict(env_file="../../.env", extra="ignore")
+    model_config = _SETTINGS_CONFIG
     
     agent_name: str = "strands-poc-agent"
     agent_provider: str = "openai"  # Can be "openai" or "bedrock"
     log_level: str = "INFO"
+    parallel_tool_calls: bool = True
+    enable_response_cache: bool = False
+    response_cache_path: str = ".cache/responses.sqlite"
+    response_cache_ttl_seconds: int = 86400
 
 
 class Settings(BaseSettings):
     """Main application settings."""
     
-    model_config = SettingsConfigDict(env_file="../../.env", extra="ignore")
+    model_config = _SETTINGS_CONFIG
     
-    aws: AWSConfig = AWSConfig()
-    bedrock: BedrockConfig = BedrockConfig()
-    bedrock_kb: BedrockKnowledgeBaseConfig = BedrockKnowledgeBaseConfig()
-    openai: OpenAIConfig = OpenAIConfig()
-    agent: AgentConfig = AgentConfig()
+    # Sub-configs are built when Settings is instantiated, not at import time,
+    # so they pick up environment variables loaded after this module is imported
+    aws: AWSConfig = Field(default_factory=AWSConfig)
+    bedrock: BedrockConfig = Field(default_factory=BedrockConfig)
+    bedrock_kb: BedrockKnowledgeBaseConfig = Field(default_factory=BedrockKnowledgeBaseConfig)
+    openai: OpenAIConfig = Field(default_factory=OpenAIConfig)
+    agent: AgentConfig = Field(default_factory=AgentConfig)
 
 
+@functools.lru_cache(maxsize=1)
 def get_settings() -> Settings:
-    """Get application settings."""
+    """Get application settings.
+    
+    Loads the nearest .env file into the environment and parses the settings
+    once; later calls return the same instance.
+    """
+    load_dotenv()
     return Settings()
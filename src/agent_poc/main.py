@@ -2,15 +2,24 @@
 
 import logging
 import sys
-from typing import NoReturn, Optional, Union
-
-from dotenv import load_dotenv
-from strands.models import BedrockModel, Model
+from typing import TYPE_CHECKING, Any, Dict, NoReturn, Optional, Union
 
 from agent_poc.config.settings import get_settings, Settings
-from agent_poc.bedrock_client import create_bedrock_model
-from agent_poc.openai_client import create_openai_model, OpenAIModel
 from agent_poc.agent import StrandsAgent
+from agent_poc.providers import create_model
+
+if TYPE_CHECKING:
+    from strands.models import BedrockModel
+    from agent_poc.openai_client import OpenAIModel
+
+HEADER: str = "=" * 60
+RULE: str = "-" * 60
+
+# Display names for the configured provider, used in logs and the system prompt
+PROVIDER_NAMES: Dict[str, str] = {
+    "openai": "OpenAI",
+    "bedrock": "AWS Bedrock",
+}
 
 
 def setup_logging(level: str = "INFO") -> None:
@@ -35,52 +44,36 @@ def main() -> Optional[StrandsAgent]:
     Raises:
         SystemExit: If there's an error initializing the agent
     """
-    # Load environment variables from .env file
-    load_dotenv()
-    
-    # Load configuration
+    # Load configuration (also loads the .env file)
     settings: Settings = get_settings()
     
     # Setup logging
     setup_logging(settings.agent.log_level)
     logger: logging.Logger = logging.getLogger(__name__)
     
-    logger.info("=" * 60)
+    logger.info(HEADER)
     logger.info("Starting Strands Agent POC")
-    logger.info("=" * 60)
+    logger.info(HEADER)
     
     try:
-        model: Union[OpenAIModel, BedrockModel]
-        system_prompt: str
+        provider: str = settings.agent.agent_provider
+        provider_name: str = PROVIDER_NAMES.get(provider, provider)
+        logger.info("Provider: %s", provider_name)
+        if provider == "bedrock":
+            logger.info("AWS Region: %s", settings.aws.aws_region)
         
         # Create model based on provider
-        if settings.agent.agent_provider == "openai":
-            logger.info(f"Provider: OpenAI")
-            logger.info(f"Model: {settings.openai.openai_model}")
-            logger.info(f"Agent Name: {settings.agent.agent_name}")
-            logger.info("=" * 60)
-            
-            logger.info("Creating OpenAI model...")
-            model = create_openai_model(settings.openai)
-            
-            system_prompt = (
-                "You are a helpful AI assistant powered by OpenAI. "
-                "You provide accurate, thoughtful, and concise responses."
-            )
-        else:  # bedrock
-            logger.info(f"Provider: AWS Bedrock")
-            logger.info(f"AWS Region: {settings.aws.aws_region}")
-            logger.info(f"Model: {settings.bedrock.bedrock_model_id}")
-            logger.info(f"Agent Name: {settings.agent.agent_name}")
-            logger.info("=" * 60)
-            
-            logger.info("Creating Bedrock model...")
-            model = create_bedrock_model(settings.aws, settings.bedrock)
-            
-            system_prompt = (
-                "You are a helpful AI assistant powered by AWS Bedrock. "
-                "You provide accurate, thoughtful, and concise responses."
-            )
+        logger.info("Creating %s model...", provider_name)
+        model: Union["OpenAIModel", "BedrockModel"] = create_model(settings)
+        model_config: Dict[str, Any] = dict(model.get_config())
+        logger.info("Model: %s", model_config.get("model_id") or model_config.get("model"))
+        logger.info("Agent Name: %s", settings.agent.agent_name)
+        logger.info(HEADER)
+        
+        system_prompt: str = (
+            f"You are a helpful AI assistant powered by {provider_name}. "
+            "You provide accurate, thoughtful, and concise responses."
+        )
         
         # Initialize Strands agent
         logger.info("Initializing Strands agent...")
@@ -95,22 +88,22 @@ def main() -> Optional[StrandsAgent]:
         
         # Demo: Simple query
         demo_query: str = "Hello! Please introduce yourself in 2-3 sentences."
-        logger.info(f"Demo Query: {demo_query}")
+        logger.info("Demo Query: %s", demo_query)
         logger.info("")
         
         response: str = agent.run(demo_query)
         
         logger.info("Agent Response:")
-        logger.info("-" * 60)
+        logger.info(RULE)
         logger.info(response)
-        logger.info("-" * 60)
+        logger.info(RULE)
         logger.info("")
         logger.info("✓ POC completed successfully!")
         
         return agent
         
     except Exception as e:
-        logger.error(f"✗ Error initializing agent: {e}", exc_info=True)
+        logger.error("✗ Error initializing agent: %s", e, exc_info=True)
         sys.exit(1)
 
 
@@ -1,28 +1,149 @@
 """OpenAI model wrapper for Strands Agents."""
 
+import asyncio
+import atexit
+import functools
+import hashlib
 import logging
-from typing import Any, AsyncIterable, Dict, List, Optional, cast
+import threading
+from collections import OrderedDict
+from typing import Any, AsyncIterable, Callable, Dict, FrozenSet, List, Optional, Tuple
 
-from openai import OpenAI
+import httpx
+import orjson
+from openai import AsyncOpenAI, DefaultAsyncHttpxClient, DefaultHttpxClient, OpenAI
 from strands.models import Model
 from strands.types.content import Message
 from strands.types.tools import ToolSpec
-from strands.types.streaming import (
-    StreamEvent,
-    MessageStartEvent,
-    MessageStopEvent,
-    ContentBlockStartEvent,
-    ContentBlockStart,
-    ContentBlockStopEvent,
-    ContentBlockDeltaEvent,
-    ContentBlockDelta,
-    ContentBlockDeltaText,
-)
+from strands.types.streaming import StreamEvent
 
 from agent_poc.config.settings import OpenAIConfig
 
 logger: logging.Logger = logging.getLogger(__name__)
 
+# Keep-alive pool shared by every OpenAI client built in this process
+_HTTP_LIMITS: httpx.Limits = httpx.Limits(
+    max_keepalive_connections=20,
+    max_connections=100,
+    keepalive_expiry=30
+)
+
+# Default bounds for coalescing streamed text deltas (characters / milliseconds)
+STREAM_BUFFER_BYTES: int = 8192
+STREAM_FLUSH_MS: float = 25
+
+# Call options set explicitly on each request, so they are not forwarded again
+# as passthrough kwargs
+_RESERVED_KW: FrozenSet[str] = frozenset(('temperature', 'max_tokens', 'stream'))
+
+# In-process LRU of deterministic (temperature 0) generate() responses
+RESPONSE_CACHE_SIZE: int = 256
+_RESPONSE_CACHE: "OrderedDict[Tuple[str, int, bytes], str]" = OrderedDict()
+_RESPONSE_CACHE_LOCK: threading.Lock = threading.Lock()
+
+# Framing events are identical for every stream, so they are built once. The
+# Strands stream types are TypedDicts and consumers only read them
+_MSG_START: StreamEvent = {'messageStart': {'role': 'assistant'}}
+_CB_START: StreamEvent = {'contentBlockStart': {'start': {'toolUse': None}, 'contentBlockIndex': 0}}  # type: ignore[typeddict-item]
+_CB_STOP: StreamEvent = {'contentBlockStop': {'contentBlockIndex': 0}}
+_MSG_STOP: StreamEvent = {'messageStop': {'stopReason': 'end_turn', 'additionalModelResponseFields': None}}
+
+
+@functools.lru_cache(maxsize=8)
+def _get_openai_client(api_key: str, base_url: Optional[str] = None) -> OpenAI:
+    """Get a pooled OpenAI client for the given credentials.
+    
+    Clients are cached per (api_key, base_url), so model instances reuse open
+    HTTP connections instead of paying a new TCP/TLS handshake each time.
+    
+    Args:
+        api_key: OpenAI API key
+        base_url: Optional API base URL
+        
+    Returns:
+        Shared OpenAI client
+    """
+    http_client: httpx.Client = DefaultHttpxClient(limits=_HTTP_LIMITS)
+    atexit.register(http_client.close)
+    return OpenAI(api_key=api_key, base_url=base_url, http_client=http_client)
+
+
+def _create_async_openai_client(api_key: str, base_url: Optional[str] = None) -> AsyncOpenAI:
+    """Create an AsyncOpenAI client for the running event loop.
+    
+    Async connections are bound to the event loop that opened them, and each
+    agent invocation runs on its own loop, so async clients are not shared:
+    callers create one per call and must close it before the loop ends.
+    
+    Args:
+        api_key: OpenAI API key
+        base_url: Optional API base URL
+        
+    Returns:
+        New AsyncOpenAI client
+    """
+    return AsyncOpenAI(
+        api_key=api_key,
+        base_url=base_url,
+        http_client=DefaultAsyncHttpxClient(limits=_HTTP_LIMITS)
+    )
+
+
+def _format_dict_block(block: Dict[str, Any]) -> Dict[str, Any]:
+    # Already a dict, ensure text blocks carry a type
+    if 'text' in block:
+        block.setdefault('type', 'text')
+    return block
+
+
+def _format_block_fallback(block: Any) -> Dict[str, Any]:
+    if isinstance(block, dict):
+        return _format_dict_block(block)
+    if hasattr(block, 'text'):
+        # Text content block
+        return {'type': 'text', 'text': block.text}
+    # Convert to text block
+    return {'type': 'text', 'text': str(block)}
+
+
+def _format_dict_message(msg: Dict[str, Any]) -> Dict[str, Any]:
+    # Already a dict, ensure each content block has a type
+    content: Any = msg.get('content')
+    if isinstance(content, list):
+        get_formatter = _BLOCK_FORMATTERS.get
+        msg['content'] = [get_formatter(type(block), _format_block_fallback)(block) for block in content]
+    return msg
+
+
+def _format_message_fallback(msg: Any) -> Dict[str, Any]:
+    if isinstance(msg, dict):
+        return _format_dict_message(msg)
+    if not (hasattr(msg, 'role') and hasattr(msg, 'content')):
+        return {'role': 'user', 'content': str(msg)}
+    if not isinstance(msg.content, list):
+        # Simple string content
+        return {'role': msg.role, 'content': str(msg.content)}
+    get_formatter = _BLOCK_FORMATTERS.get
+    content_blocks: List[Dict[str, Any]] = [
+        get_formatter(type(block), _format_block_fallback)(block) for block in msg.content
+    ]
+    # If only one text block, simplify to string
+    if len(content_blocks) == 1 and content_blocks[0].get('type') == 'text':
+        return {'role': msg.role, 'content': content_blocks[0]['text']}
+    return {'role': msg.role, 'content': content_blocks}
+
+
+# Formatters keyed on the exact runtime type, so the common case (Strands
+# messages and content blocks are TypedDicts, i.e. plain dicts) is a single
+# dict lookup; anything else goes through the duck-typed fallbacks
+_BLOCK_FORMATTERS: Dict[type, Callable[[Any], Dict[str, Any]]] = {
+    dict: _format_dict_block,
+    str: lambda block: {'type': 'text', 'text': block},
+}
+_MESSAGE_FORMATTERS: Dict[type, Callable[[Any], Dict[str, Any]]] = {
+    dict: _format_dict_message,
+}
+
 
 class OpenAIModel(Model):
     """OpenAI model wrapper that implements the Strands Model interface."""
@@ -45,15 +166,23 @@ class OpenAIModel(Model):
         self.model_name: str = model
         self.temperature: float = temperature
         self.max_tokens: int = max_tokens
-        self.client: OpenAI = OpenAI(api_key=api_key)
+        self.api_key: str = api_key
+        self.client: OpenAI = _get_openai_client(api_key)
         logger.info(f"Initialized OpenAI model: {model}")
     
-    def generate(self, messages: List[Any], **kwargs: Any) -> str:
+    def generate(
+        self,
+        messages: List[Any],
+        system_prompt: Optional[str] = None,
+        **kwargs: Any
+    ) -> str:
         """Generate a response from the model.
         
         Args:
             messages: List of message dictionaries
-            **kwargs: Additional generation parameters
+            system_prompt: Optional system prompt to prepend
+            **kwargs: Additional generation parameters; pass ``no_cache=True``
+                to bypass the response cache used at temperature 0
             
         Returns:
             Model response as a string
@@ -61,19 +190,113 @@ class OpenAIModel(Model):
         Raises:
             Exception: If there's an error generating the response
         """
+        no_cache: bool = kwargs.pop('no_cache', False)
+        temperature: float = kwargs.get('temperature', self.temperature)
+        max_tokens: int = kwargs.get('max_tokens', self.max_tokens)
+        extra: Dict[str, Any] = {k: v for k, v in kwargs.items() if k not in _RESERVED_KW} if kwargs else {}
+        
         # Convert Strands message format to OpenAI format if needed
         formatted_messages: List[Dict[str, str]] = self._format_messages(messages)
+        if system_prompt:
+            formatted_messages.insert(0, {'role': 'system', 'content': system_prompt})
+        
+        # Only temperature 0 calls are deterministic enough to answer from cache
+        cache_key: Optional[Tuple[str, int, bytes]] = None
+        if temperature == 0 and not no_cache:
+            digest: bytes = hashlib.blake2b(
+                orjson.dumps([formatted_messages, extra], default=str, option=orjson.OPT_SORT_KEYS),
+                digest_size=16
+            ).digest()
+            cache_key = (self.model_name, max_tokens, digest)
+            with _RESPONSE_CACHE_LOCK:
+                cached: Optional[str] = _RESPONSE_CACHE.get(cache_key)
+                if cached is not None:
+                    _RESPONSE_CACHE.move_to_end(cache_key)
+                    return cached
         
         response: Any = self.client.chat.completions.create(
             model=self.model_name,
             messages=formatted_messages,  # type: ignore[arg-type]
-            temperature=kwargs.get('temperature', self.temperature),
-            max_tokens=kwargs.get('max_tokens', self.max_tokens),
-            **{k: v for k, v in kwargs.items() if k not in ['temperature', 'max_tokens']}
+            temperature=temperature,
+            max_tokens=max_tokens,
+            **extra
         )
         
         content: Any = response.choices[0].message.content
-        return str(content) if content else ""
+        result: str = str(content) if content else ""
+        
+        if cache_key is not None:
+            with _RESPONSE_CACHE_LOCK:
+                _RESPONSE_CACHE[cache_key] = result
+                _RESPONSE_CACHE.move_to_end(cache_key)
+                while len(_RESPONSE_CACHE) > RESPONSE_CACHE_SIZE:
+                    _RESPONSE_CACHE.popitem(last=False)
+        
+        return result
+    
+    async def agenerate_many(
+        self,
+        batch: List[List[Any]],
+        concurrency: int = 8,
+        **kwargs: Any
+    ) -> List[str]:
+        """Generate responses for several independent prompts concurrently.
+        
+        Chat Completions has no prompt-array batching, so the requests are
+        sent in parallel instead, bounded by ``concurrency`` to respect rate limits.
+        
+        Args:
+            batch: One message list per prompt
+            concurrency: Maximum number of requests in flight at once
+            **kwargs: Additional generation parameters
+            
+        Returns:
+            Model responses, in the same order as ``batch``
+        """
+        semaphore: asyncio.Semaphore = asyncio.Semaphore(concurrency)
+        client: AsyncOpenAI = _create_async_openai_client(self.api_key)
+        temperature: float = kwargs.get('temperature', self.temperature)
+        max_tokens: int = kwargs.get('max_tokens', self.max_tokens)
+        extra: Dict[str, Any] = {k: v for k, v in kwargs.items() if k not in _RESERVED_KW} if kwargs else {}
+        
+        async def generate_one(messages: List[Any]) -> str:
+            async with semaphore:
+                response: Any = await client.chat.completions.create(
+                    model=self.model_name,
+                    messages=self._format_messages(messages),  # type: ignore[arg-type]
+                    temperature=temperature,
+                    max_tokens=max_tokens,
+                    **extra
+                )
+            content: Any = response.choices[0].message.content
+            return str(content) if content else ""
+        
+        try:
+            return list(await asyncio.gather(*(generate_one(messages) for messages in batch)))
+        finally:
+            # Release the connections before the caller's event loop closes
+            await client.close()
+    
+    def generate_many(
+        self,
+        batch: List[List[Any]],
+        concurrency: int = 8,
+        **kwargs: Any
+    ) -> List[str]:
+        """Generate responses for several independent prompts concurrently.
+        
+        Synchronous wrapper around ``agenerate_many``; must not be called from
+        a running event loop.
+        
+        Args:
+            batch: One message list per prompt
+            concurrency: Maximum number of requests in flight at once
+            **kwargs: Additional generation parameters
+            
+        Returns:
+            Model responses, in the same order as ``batch``
+        """
+        return asyncio.run(self.agenerate_many(batch, concurrency=concurrency, **kwargs))
     
     def _format_messages(self, messages: List[Any]) -> List[Dict[str, str]]:
         """Format messages for OpenAI API.
@@ -127,53 +350,115 @@ class OpenAIModel(Model):
     ) -> AsyncIterable[StreamEvent]:
         """Stream responses from the model.
         
+        The first text delta is emitted as soon as it arrives. Later deltas are
+        coalesced and emitted once ``stream_buffer_bytes`` characters are buffered
+        or ``stream_flush_ms`` has passed since the last emitted delta, even if
+        the API has not sent anything new in the meantime, which cuts per-token
+        event overhead. Lower values favour latency, higher values throughput.
+        
         Args:
             messages: List of message objects
             tool_specs: Optional list of tool specifications
             system_prompt: Optional system prompt
-            **kwargs: Additional generation parameters
+            **kwargs: Additional generation parameters, plus the optional
+                ``stream_buffer_bytes`` and ``stream_flush_ms`` buffering bounds
             
         Yields:
             Stream events
         """
-        formatted_messages: List[Dict[str, Any]] = self._format_messages_with_system(messages, system_prompt)
+        buffer_limit: int = int(kwargs.pop('stream_buffer_bytes', STREAM_BUFFER_BYTES))
+        flush_interval: float = float(kwargs.pop('stream_flush_ms', STREAM_FLUSH_MS)) / 1000
         
-        # Yield message start event
-        yield {'messageStart': MessageStartEvent(role='assistant')}
+        formatted_messages: List[Dict[str, Any]] = self._format_messages_with_system(messages, system_prompt)
         
-        # Yield content block start event  
-        yield {'contentBlockStart': ContentBlockStartEvent(
-            start=ContentBlockStart(toolUse=None),
-            contentBlockIndex=0
-        )}
+        # Yield the message and content block start events
+        yield _MSG_START
+        yield _CB_START
         
-        stream_response = self.client.chat.completions.create(
-            model=self.model_name,
-            messages=formatted_messages,  # type: ignore[arg-type]
-            temperature=kwargs.get('temperature', self.temperature),
-            max_tokens=kwargs.get('max_tokens', self.max_tokens),
-            stream=True,
-            **{k: v for k, v in kwargs.items() if k not in ['temperature', 'max_tokens', 'stream']}
-        )
+        client: AsyncOpenAI = _create_async_openai_client(self.api_key)
+        try:
+            stream_response = await client.chat.completions.create(
+                model=self.model_name,
+                messages=formatted_messages,  # type: ignore[arg-type]
+                temperature=kwargs.get('temperature', self.temperature),
+                max_tokens=kwargs.get('max_tokens', self.max_tokens),
+                stream=True,
+                **({k: v for k, v in kwargs.items() if k not in _RESERVED_KW} if kwargs else {})
+            )
+            
+            loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+            chunks: Any = stream_response.__aiter__()
+            next_chunk: "Optional[asyncio.Future[Any]]" = None
+            buffer: List[str] = []
+            buffered: int = 0
+            # Starting "long ago" lets the first delta through immediately
+            last_flush: float = float('-inf')
+            
+            # Bind per-token lookups to locals for the hot loop
+            now = loop.time
+            append = buffer.append
+            
+            try:
+                while True:
+                    if buffer:
+                        # Wait for the next chunk only until the flush deadline, so
+                        # buffered text isn't held back while the API is quiet. The
+                        # read is left pending rather than cancelled, which would
+                        # break the underlying HTTP stream
+                        if next_chunk is None:
+                            next_chunk = asyncio.ensure_future(chunks.__anext__())
+                        done, _ = await asyncio.wait((next_chunk,), timeout=max(0.0, last_flush + flush_interval - now()))
+                        if not done:
+                            yield {'contentBlockDelta': {'delta': {'text': "".join(buffer)}, 'contentBlockIndex': 0}}
+                            buffer.clear()
+                            buffered = 0
+                            last_flush = now()
+                            continue
+                    try:
+                        if next_chunk is None:
+                            chunk: Any = await chunks.__anext__()
+                        else:
+                            chunk = await next_chunk
+                            next_chunk = None
+                    except StopAsyncIteration:
+                        break
+                    
+                    # The SDK always yields ChatCompletionChunk objects; only `choices`
+                    # may be empty (e.g. a trailing usage chunk)
+                    choices: Any = chunk.choices
+                    if not choices:
+                        continue
+                    choice: Any = choices[0]
+                    text: Optional[str] = choice.delta.content
+                    if text:
+                        append(text)
+                        buffered += len(text)
+                    
+                    if buffer and (
+                        choice.finish_reason is not None
+                        or buffered >= buffer_limit
+                        or now() - last_flush >= flush_interval
+                    ):
+                        # Yield content block delta event with only text. The Strands
+                        # stream types are TypedDicts, so a dict literal builds the same
+                        # event without the constructor calls
+                        yield {'contentBlockDelta': {'delta': {'text': "".join(buffer)}, 'contentBlockIndex': 0}}
+                        buffer.clear()
+                        buffered = 0
+                        last_flush = now()
+            finally:
+                if next_chunk is not None:
+                    next_chunk.cancel()
+            
+            if buffer:
+                yield {'contentBlockDelta': {'delta': {'text': "".join(buffer)}, 'contentBlockIndex': 0}}
+        finally:
+            # Release the connections before this invocation's event loop closes
+            await client.close()
         
-        for chunk in stream_response:
-            if hasattr(chunk, 'choices') and chunk.choices and chunk.choices[0].delta.content:
-                # Yield content block delta event with only text
-                yield {'contentBlockDelta': ContentBlockDeltaEvent(
-                    delta=ContentBlockDelta(
-                        text=chunk.choices[0].delta.content
-                    ),
-                    contentBlockIndex=0
-                )}
-        
-        # Yield content block stop event
-        yield {'contentBlockStop': ContentBlockStopEvent(contentBlockIndex=0)}
-        
-        # Yield message stop event
-        yield {'messageStop': MessageStopEvent(
-            stopReason='end_turn',
-            additionalModelResponseFields=None
-        )}
+        # Yield the content block and message stop events
+        yield _CB_STOP
+        yield _MSG_STOP
     
     def _format_messages_with_system(
         self,
@@ -196,50 +481,9 @@ class OpenAIModel(Model):
             formatted.append({'role': 'system', 'content': system_prompt})
         
         # Format other messages
+        get_formatter = _MESSAGE_FORMATTERS.get
         for msg in messages:
-            if hasattr(msg, 'role') and hasattr(msg, 'content'):
-                # Handle content blocks properly
-                if isinstance(msg.content, list):
-                    # Check if content blocks have proper structure
-                    content_blocks = []
-                    for block in msg.content:
-                        if hasattr(block, 'text'):
-                            # Text content block
-                            content_blocks.append({'type': 'text', 'text': block.text})
-                        elif isinstance(block, dict):
-                            # Already a dict, ensure it has type
-                            if 'type' not in block and 'text' in block:
-                                block['type'] = 'text'
-                            content_blocks.append(block)
-                        else:
-                            # Convert to text block
-                            content_blocks.append({'type': 'text', 'text': str(block)})
-                    
-                    # If only one text block, simplify to string
-                    if len(content_blocks) == 1 and content_blocks[0].get('type') == 'text':
-                        formatted.append({'role': msg.role, 'content': content_blocks[0]['text']})
-                    else:
-                        formatted.append({'role': msg.role, 'content': content_blocks})
-                else:
-                    # Simple string content
-                    formatted.append({'role': msg.role, 'content': str(msg.content)})
-            elif isinstance(msg, dict):
-                # Already a dict, ensure content format is correct
-                if 'content' in msg and isinstance(msg['content'], list):
-                    # Ensure each content block has a type
-                    content_blocks = []
-                    for block in msg['content']:
-                        if isinstance(block, dict):
-                            if 'type' not in block and 'text' in block:
-                                block['type'] = 'text'
-                            content_blocks.append(block)
-                        else:
-                            content_blocks.append({'type': 'text', 'text': str(block)})
-                    msg['content'] = content_blocks
-                formatted.append(msg)
-            else:
-                # Fallback
-                formatted.append({'role': 'user', 'content': str(msg)})
+            formatted.append(get_formatter(type(msg), _format_message_fallback)(msg))
         
         return formatted
     
@@ -263,11 +507,8 @@ class OpenAIModel(Model):
         Returns:
             Structured output matching the schema
         """
-        # Format messages including system prompt
-        formatted_messages = self._format_messages_with_system(messages, system_prompt)
-        
         # Placeholder implementation - would need JSON mode or function calling
-        response_text = self.generate(messages, **kwargs)
+        response_text = self.generate(messages, system_prompt=system_prompt, **kwargs)
         return {'response': response_text}
 
 
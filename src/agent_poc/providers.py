@@ -0,0 +1,53 @@
+"""Model provider registry.
+
+Maps the ``AGENT_PROVIDER`` setting to the factory that builds the model, so
+call sites create models through a single ``create_model`` call.
+"""
+
+from typing import TYPE_CHECKING, Callable, Dict, Union
+
+from agent_poc.config.settings import Settings
+
+if TYPE_CHECKING:
+    from strands.models import BedrockModel
+    from agent_poc.openai_client import OpenAIModel
+
+
+def _create_openai(settings: Settings) -> "OpenAIModel":
+    # Provider clients are imported on demand so only the selected one is loaded
+    from agent_poc.openai_client import create_openai_model
+    return create_openai_model(settings.openai)
+
+
+def _create_bedrock(settings: Settings) -> "BedrockModel":
+    from agent_poc.bedrock_client import create_bedrock_model
+    return create_bedrock_model(settings.aws, settings.bedrock)
+
+
+_PROVIDERS: Dict[str, Callable[[Settings], Union["OpenAIModel", "BedrockModel"]]] = {
+    "openai": _create_openai,
+    "bedrock": _create_bedrock,
+}
+
+
+def create_model(settings: Settings) -> Union["OpenAIModel", "BedrockModel"]:
+    """Create the model for the configured provider.
+
+    Args:
+        settings: Application settings
+
+    Returns:
+        Configured model instance
+
+    Raises:
+        ValueError: If the configured provider is not supported
+    """
+    provider: str = settings.agent.agent_provider
+    try:
+        factory = _PROVIDERS[provider]
+    except KeyError:
+        raise ValueError(
+            f"Unsupported agent provider: {provider!r}. "
+            f"Choose one of: {', '.join(sorted(_PROVIDERS))}."
+        ) from None
+    return factory(settings)
@@ -4,25 +4,172 @@ This module provides example tools that can be used with the Strands agent.
 Tools allow the agent to perform actions and retrieve information beyond its base knowledge.
 """
 
+import ast
+import asyncio
+import functools
+import io
 import logging
+import operator
+import threading
+import time
 from datetime import datetime
-from typing import Annotated, List, Optional
-import boto3
-from botocore.exceptions import ClientError
+from typing import Annotated, Any, Callable, Dict, List, Optional, Tuple, Type
 
-from agent_poc.config.settings import get_settings
+from agent_poc.config.settings import Settings, get_settings
 
 logger: logging.Logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=8)
+def _get_bedrock_runtime(
+    region: str,
+    access_key: Optional[str],
+    secret_key: Optional[str],
+    session_token: Optional[str]
+) -> Any:
+    """Get a cached Bedrock Agent Runtime client.
+    
+    Building a session and client loads service models and resolves
+    credentials, so one client per credential set is reused across tool calls
+    (which also keeps its HTTPS connections alive).
+    
+    Args:
+        region: AWS region of the knowledge base
+        access_key: Optional AWS access key ID
+        secret_key: Optional AWS secret access key
+        session_token: Optional AWS session token
+        
+    Returns:
+        A boto3 ``bedrock-agent-runtime`` client
+    """
+    # Imported here so the other tools (and their tests) never load boto3
+    import boto3
+    from botocore.config import Config
+    
+    # Connection pool and retry settings for the Bedrock Agent Runtime client
+    config = Config(
+        max_pool_connections=50,
+        retries={'max_attempts': 3, 'mode': 'adaptive'},
+        tcp_keepalive=True
+    )
+    session = boto3.Session(
+        aws_access_key_id=access_key,
+        aws_secret_access_key=secret_key,
+        aws_session_token=session_token,
+        region_name=region
+    )
+    return session.client('bedrock-agent-runtime', config=config)
+
+
+# Characters a calculator expression may contain; translate() strips them so
+# any leftover character means the expression is rejected
+_ALLOWED_CHARS: str = "0123456789+-*/(). "
+_DISALLOWED: Dict[int, Optional[int]] = str.maketrans('', '', _ALLOWED_CHARS)
+
+# Bounds for ``**`` so expressions like "9**9**9" cannot pin a CPU or leave
+# huge integers in the result cache
+_MAX_EXPONENT: int = 100
+_MAX_POW_BASE_BITS: int = 64
+
+
+def _bounded_pow(base: float, exponent: float) -> float:
+    """Raise ``base`` to ``exponent`` within the calculator's size limits.
+    
+    Args:
+        base: The base
+        exponent: The exponent
+        
+    Returns:
+        ``base ** exponent``
+        
+    Raises:
+        ValueError: If the exponent or an integer base is too large
+    """
+    if abs(exponent) > _MAX_EXPONENT:
+        raise ValueError(f"Exponent too large (limit is {_MAX_EXPONENT})")
+    if isinstance(base, int) and base.bit_length() > _MAX_POW_BASE_BITS:
+        raise ValueError("Base too large for exponentiation")
+    result: float = operator.pow(base, exponent)
+    return result
+
+
+# Arithmetic operators the calculator evaluates; any other AST node is rejected
+_SAFE_OPS: Dict[Type[ast.AST], Callable[..., float]] = {
+    ast.Add: operator.add,
+    ast.Sub: operator.sub,
+    ast.Mult: operator.mul,
+    ast.Div: operator.truediv,
+    ast.FloorDiv: operator.floordiv,
+    ast.Pow: _bounded_pow,
+    ast.USub: operator.neg,
+    ast.UAdd: operator.pos,
+}
+
+
+def _eval_node(node: ast.AST) -> float:
+    """Evaluate a whitelisted arithmetic AST node.
+    
+    Args:
+        node: Node of a parsed expression
+        
+    Returns:
+        The numeric value of the node
+        
+    Raises:
+        ValueError: If the node is not plain arithmetic on numbers
+    """
+    if isinstance(node, ast.Expression):
+        return _eval_node(node.body)
+    if isinstance(node, ast.Constant) and isinstance(node.value, (int, float)) and not isinstance(node.value, bool):
+        return node.value
+    if isinstance(node, ast.BinOp) and type(node.op) in _SAFE_OPS:
+        return _SAFE_OPS[type(node.op)](_eval_node(node.left), _eval_node(node.right))
+    if isinstance(node, ast.UnaryOp) and type(node.op) in _SAFE_OPS:
+        return _SAFE_OPS[type(node.op)](_eval_node(node.operand))
+    raise ValueError(f"Unsupported expression element: {type(node).__name__}")
+
+
+@functools.lru_cache(maxsize=256)
+def _evaluate(expression: str) -> float:
+    """Parse and evaluate an arithmetic expression, caching the result.
+    
+    Args:
+        expression: A mathematical expression (e.g., "2 + 2")
+        
+    Returns:
+        The numeric result
+    """
+    return _eval_node(ast.parse(expression, mode="eval"))
+
+
+# Clock used by get_current_time; a module-level alias so tests can replace it
+# without patching time.time for every other caller
+_now: Callable[[], float] = time.time
+
+# Last (timestamp, ISO string) returned by get_current_time. The pair is
+# rebound as one tuple, so concurrent tool calls never see a timestamp next to
+# another call's text; a race only means both calls format the time
+_LAST_TIME: Tuple[float, str] = (0.0, "")
+
+
 def get_current_time() -> str:
     """Get the current time.
     
+    The formatted time is reused for up to one second, which is as precise as
+    an agent needs and keeps tight tool loops from reformatting it every call.
+    
     Returns:
         Current time in ISO format
     """
-    logger.info("Tool called: get_current_time")
-    current_time: str = datetime.now().isoformat()
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("Tool called: get_current_time")
+    global _LAST_TIME
+    now: float = _now()
+    last_time, last_text = _LAST_TIME
+    if 0 <= now - last_time < 1.0:
+        return last_text
+    current_time: str = datetime.fromtimestamp(now).isoformat()
+    _LAST_TIME = (now, current_time)
     return current_time
 
 
@@ -40,22 +187,145 @@ def calculate(
     Raises:
         Exception: If the expression is invalid or contains unsafe characters
     """
-    logger.info(f"Tool called: calculate with expression: {expression}")
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("Tool called: calculate with expression: %s", expression)
     
     try:
         # Only allow safe operations
-        allowed_chars: set[str] = set("0123456789+-*/(). ")
-        if not all(c in allowed_chars for c in expression):
+        if expression.translate(_DISALLOWED):
             return "Error: Expression contains invalid characters"
         
-        # Evaluate safely
-        result: float = eval(expression, {"__builtins__": {}}, {})
+        # Evaluate the parsed expression without going through eval()
+        # ast.parse rejects leading whitespace as an indent, unlike eval()
+        result: float = _evaluate(expression.strip())
         return str(result)
     except Exception as e:
-        logger.error(f"Calculation error: {e}")
+        logger.error("Calculation error: %s", e)
         return f"Error: {str(e)}"
 
 
+def make_query_kb_tool(settings: Optional[Settings] = None) -> Callable[..., str]:
+    """Create a Bedrock Knowledge Base query tool bound to the given settings.
+    
+    The knowledge base ID is resolved here. The Bedrock Agent Runtime client is
+    created on the first call and reused by later ones, so a client that cannot
+    be built is reported as a tool error rather than failing agent setup.
+    
+    Args:
+        settings: Application settings (defaults to get_settings())
+        
+    Returns:
+        A ``query_bedrock_knowledge_base`` tool to register with the agent
+    """
+    from botocore.exceptions import ClientError
+    
+    settings = settings or get_settings()
+    kb_id: Optional[str] = settings.bedrock_kb.bedrock_kb_id
+    clients: List[Any] = []
+    client_lock: threading.Lock = threading.Lock()
+    
+    def get_client() -> Any:
+        # Batched queries call the tool from several threads at once
+        with client_lock:
+            if not clients:
+                clients.append(_get_bedrock_runtime(
+                    settings.bedrock_kb.bedrock_kb_region,
+                    settings.aws.aws_access_key_id,
+                    settings.aws.aws_secret_access_key,
+                    settings.aws.aws_session_token
+                ))
+            return clients[0]
+    
+    def query_bedrock_knowledge_base(
+        query: Annotated[str, "The search query to search the knowledge base"],
+        max_results: Annotated[int, "Maximum number of results to return (default: 5)"] = 5
+    ) -> str:
+        """Query an AWS Bedrock Knowledge Base for information.
+        
+        This tool connects to an AWS Bedrock Knowledge Base and retrieves relevant
+        information based on the provided query. The knowledge base uses vector search
+        to find the most relevant documents.
+        
+        Args:
+            query: The search query to find relevant information
+            max_results: Maximum number of results to return (default: 5)
+            
+        Returns:
+            Retrieved information from the knowledge base, formatted as text
+            
+        Raises:
+            Exception: If there's an error querying the knowledge base
+        """
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Tool called: query_bedrock_knowledge_base with query: %s", query)
+        
+        # Check if KB ID is configured
+        if not kb_id:
+            return "Error: Bedrock Knowledge Base ID is not configured. Please set BEDROCK_KB_ID in your .env file."
+        
+        try:
+            # Query the knowledge base
+            logger.info("Querying KB ID: %s", kb_id)
+            response = get_client().retrieve(
+                knowledgeBaseId=kb_id,
+                retrievalQuery={
+                    'text': query
+                },
+                retrievalConfiguration={
+                    'vectorSearchConfiguration': {
+                        'numberOfResults': max_results
+                    }
+                }
+            )
+            
+            # Extract and format results
+            retrieval_results = response.get('retrievalResults', [])
+            
+            if not retrieval_results:
+                return f"No results found in the knowledge base for query: '{query}'"
+            
+            # Format the results in a single pass
+            buffer = io.StringIO()
+            write = buffer.write
+            write(f"Knowledge Base Search Results for '{query}':\n\n")
+            for i, result in enumerate(retrieval_results, 1):
+                get = result.get
+                content = get('content', {}).get('text', 'No content available')
+                score = get('score', 0.0)
+                location = get('location', {})
+                
+                # Extract source information
+                source_info = ""
+                if location.get('type') == 'S3':
+                    s3_location = location.get('s3Location', {})
+                    source_info = f"Source: s3://{s3_location.get('uri', 'unknown')}"
+                
+                if i > 1:
+                    write("\n")
+                write(f"Result {i} (relevance: {score:.2f}):\n{content}\n{source_info}\n")
+            
+            logger.info("Successfully retrieved %d results from knowledge base", len(retrieval_results))
+            
+            return buffer.getvalue()
+            
+        except ClientError as e:
+            error_code = e.response['Error']['Code']
+            error_message = e.response['Error']['Message']
+            logger.error("AWS ClientError: %s - %s", error_code, error_message)
+            return f"Error querying knowledge base: {error_code} - {error_message}"
+        except Exception as e:
+            # Tracebacks are only worth formatting when debugging
+            logger.error("Error querying knowledge base: %s", e, exc_info=logger.isEnabledFor(logging.DEBUG))
+            return f"Error querying knowledge base: {str(e)}"
+    
+    return query_bedrock_knowledge_base
+
+
+@functools.lru_cache(maxsize=1)
+def _default_query_kb_tool() -> Callable[..., str]:
+    return make_query_kb_tool()
+
+
 def query_bedrock_knowledge_base(
     query: Annotated[str, "The search query to search the knowledge base"],
     max_results: Annotated[int, "Maximum number of results to return (default: 5)"] = 5
@@ -76,78 +346,38 @@ def query_bedrock_knowledge_base(
     Raises:
         Exception: If there's an error querying the knowledge base
     """
-    logger.info(f"Tool called: query_bedrock_knowledge_base with query: {query}")
+    return _default_query_kb_tool()(query, max_results)
+
+
+async def query_bedrock_knowledge_base_many(
+    queries: List[str],
+    max_results: int = 5,
+    settings: Optional[Settings] = None,
+    concurrency: int = 8
+) -> List[str]:
+    """Query the Bedrock Knowledge Base for several queries concurrently.
     
-    try:
-        # Load settings
-        settings = get_settings()
-        
-        # Check if KB ID is configured
-        if not settings.bedrock_kb.bedrock_kb_id:
-            return "Error: Bedrock Knowledge Base ID is not configured. Please set BEDROCK_KB_ID in your .env file."
-        
-        # Initialize the Bedrock Agent Runtime client
-        session = boto3.Session(
-            aws_access_key_id=settings.aws.aws_access_key_id,
-            aws_secret_access_key=settings.aws.aws_secret_access_key,
-            aws_session_token=settings.aws.aws_session_token,
-            region_name=settings.bedrock_kb.bedrock_kb_region
-        )
-        
-        bedrock_agent_runtime = session.client('bedrock-agent-runtime')
-        
-        # Query the knowledge base
-        logger.info(f"Querying KB ID: {settings.bedrock_kb.bedrock_kb_id}")
-        response = bedrock_agent_runtime.retrieve(
-            knowledgeBaseId=settings.bedrock_kb.bedrock_kb_id,
-            retrievalQuery={
-                'text': query
-            },
-            retrievalConfiguration={
-                'vectorSearchConfiguration': {
-                    'numberOfResults': max_results
-                }
-            }
-        )
-        
-        # Extract and format results
-        retrieval_results = response.get('retrievalResults', [])
-        
-        if not retrieval_results:
-            return f"No results found in the knowledge base for query: '{query}'"
-        
-        # Format the results
-        formatted_results = []
-        for i, result in enumerate(retrieval_results, 1):
-            content = result.get('content', {}).get('text', 'No content available')
-            score = result.get('score', 0.0)
-            location = result.get('location', {})
-            
-            # Extract source information
-            source_info = ""
-            if location.get('type') == 'S3':
-                s3_location = location.get('s3Location', {})
-                source_info = f"Source: s3://{s3_location.get('uri', 'unknown')}"
-            
-            formatted_results.append(
-                f"Result {i} (relevance: {score:.2f}):\n"
-                f"{content}\n"
-                f"{source_info}\n"
-            )
-        
-        result_text = "\n".join(formatted_results)
-        logger.info(f"Successfully retrieved {len(retrieval_results)} results from knowledge base")
-        
-        return f"Knowledge Base Search Results for '{query}':\n\n{result_text}"
+    The retrieve API takes one query per request, so the requests are run in
+    parallel on worker threads sharing the pooled client, bounded by
+    ``concurrency``.
+    
+    Args:
+        queries: Search queries to run
+        max_results: Maximum number of results to return per query
+        settings: Application settings (defaults to get_settings())
+        concurrency: Maximum number of requests in flight at once
         
-    except ClientError as e:
-        error_code = e.response['Error']['Code']
-        error_message = e.response['Error']['Message']
-        logger.error(f"AWS ClientError: {error_code} - {error_message}")
-        return f"Error querying knowledge base: {error_code} - {error_message}"
-    except Exception as e:
-        logger.error(f"Error querying knowledge base: {e}", exc_info=True)
-        return f"Error querying knowledge base: {str(e)}"
+    Returns:
+        Formatted results, in the same order as ``queries``
+    """
+    tool: Callable[..., str] = make_query_kb_tool(settings) if settings else _default_query_kb_tool()
+    semaphore: asyncio.Semaphore = asyncio.Semaphore(concurrency)
+    
+    async def query_one(query: str) -> str:
+        async with semaphore:
+            return await asyncio.to_thread(tool, query, max_results)
+    
+    return list(await asyncio.gather(*(query_one(query) for query in queries)))
 
 
 def search_knowledge_base(
@@ -163,7 +393,7 @@ def search_knowledge_base(
     Returns:
         Search results or relevant information
     """
-    logger.info(f"Tool called: search_knowledge_base with query: {query}")
+    logger.info("Tool called: search_knowledge_base with query: %s", query)
     
     # Placeholder implementation
     result: str = (
@@ -179,5 +409,7 @@ __all__: List[str] = [
     "get_current_time",
     "calculate",
     "query_bedrock_knowledge_base",
+    "query_bedrock_knowledge_base_many",
+    "make_query_kb_tool",
     "search_knowledge_base",
 ]
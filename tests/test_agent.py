@@ -1,8 +1,12 @@
 """Tests for the Strands agent."""
 
+import asyncio
+
 import pytest
 from unittest.mock import Mock, MagicMock
 
+from strands.tools.executors import ConcurrentToolExecutor, SequentialToolExecutor
+
 from agent_poc.agent import StrandsAgent
 from agent_poc.config.settings import AgentConfig
 
@@ -18,9 +22,7 @@ def mock_bedrock_model():
 def mock_agent_response():
     """Create a mock agent response."""
     response = Mock()
-    message = Mock()
-    message.content = "Test response from agent"
-    response.messages = [message]
+    response.message = {"role": "assistant", "content": [{"text": "Test response from agent"}]}
     return response
 
 
@@ -49,14 +51,41 @@ def test_agent_initialization(agent):
     assert agent.agent is not None
 
 
+@pytest.mark.parametrize(
+    "parallel_tool_calls, executor_class",
+    [(True, ConcurrentToolExecutor), (False, SequentialToolExecutor)],
+)
+def test_agent_tool_executor(mock_bedrock_model, monkeypatch, parallel_tool_calls, executor_class):
+    """Test the tool executor follows the parallel_tool_calls setting."""
+    import agent_poc.agent as agent_module
+    mock_agent_class = Mock()
+    monkeypatch.setattr(agent_module, "Agent", mock_agent_class)
+    
+    config = AgentConfig(agent_name="test-agent", parallel_tool_calls=parallel_tool_calls)
+    StrandsAgent(mock_bedrock_model, config)
+    
+    _, kwargs = mock_agent_class.call_args
+    assert isinstance(kwargs["tool_executor"], executor_class)
+
+
 def test_agent_run(agent, mock_agent_response):
     """Test basic agent run."""
-    agent.agent.run = Mock(return_value=mock_agent_response)
+    agent.agent.return_value = mock_agent_response
     
     response = agent.run("Hello")
     
     assert response == "Test response from agent"
-    agent.agent.run.assert_called_once_with("Hello", stream=False)
+    agent.agent.assert_called_once_with("Hello")
+
+
+def test_agent_run_unexpected_response_shape(agent):
+    """Test responses without a text content block fall back to str()."""
+    response = Mock()
+    response.message = {"role": "assistant", "content": []}
+    response.__str__ = Mock(return_value="Fallback text")
+    agent.agent.return_value = response
+    
+    assert agent.run("Hello") == "Fallback text"
 
 
 def test_agent_add_tool(agent):
@@ -82,6 +111,22 @@ def test_agent_reset_conversation(agent, mock_bedrock_model, monkeypatch):
     assert agent.agent == mock_new_agent
 
 
+def test_agent_reset_conversation_clears_history(agent, monkeypatch):
+    """Test conversation reset clears the history in place when possible."""
+    import agent_poc.agent as agent_module
+    mock_agent_class = Mock()
+    monkeypatch.setattr(agent_module, "Agent", mock_agent_class)
+    original_agent = agent.agent
+    original_agent.messages = [Mock(), Mock()]
+    
+    agent.reset_conversation()
+    
+    # Verify the existing agent was kept and its history emptied
+    assert agent.agent is original_agent
+    assert agent.agent.messages == []
+    mock_agent_class.assert_not_called()
+
+
 def test_conversation_history_property(agent):
     """Test conversation history property."""
     mock_messages = [Mock(), Mock()]
@@ -101,3 +146,136 @@ def test_conversation_history_empty(agent):
     history = agent.conversation_history
     
     assert history == []
+
+
+def test_agent_run_uses_response_cache(mock_bedrock_model, monkeypatch, tmp_path):
+    """Test repeated queries are served from the response cache."""
+    import agent_poc.agent as agent_module
+    mock_strands_agent = MagicMock()
+    mock_strands_agent.messages = []
+    mock_strands_agent.system_prompt = "Test prompt"
+    mock_strands_agent.return_value.message = {"role": "assistant", "content": [{"text": "Cached answer"}]}
+    monkeypatch.setattr(agent_module, "Agent", Mock(return_value=mock_strands_agent))
+    mock_bedrock_model.get_config.return_value = {"model_id": "test-model", "temperature": 0.0}
+    
+    config = AgentConfig(
+        agent_name="test-agent",
+        enable_response_cache=True,
+        response_cache_path=str(tmp_path / "responses.sqlite")
+    )
+    agent_instance = StrandsAgent(mock_bedrock_model, config)
+    
+    assert agent_instance.run("What's 2+2?") == "Cached answer"
+    agent_instance.reset_conversation()
+    assert agent_instance.run("What's 2+2?") == "Cached answer"
+    
+    # Second call is answered from the cache without invoking the model
+    mock_strands_agent.assert_called_once_with("What's 2+2?")
+
+
+def test_agent_run_skips_cache_at_high_temperature(mock_bedrock_model, monkeypatch, tmp_path):
+    """Test responses are not cached when sampling is non-deterministic."""
+    import agent_poc.agent as agent_module
+    mock_strands_agent = MagicMock()
+    mock_strands_agent.messages = []
+    mock_strands_agent.return_value.message = {"role": "assistant", "content": [{"text": "Answer"}]}
+    monkeypatch.setattr(agent_module, "Agent", Mock(return_value=mock_strands_agent))
+    mock_bedrock_model.get_config.return_value = {"model_id": "test-model", "temperature": 0.7}
+    
+    config = AgentConfig(
+        agent_name="test-agent",
+        enable_response_cache=True,
+        response_cache_path=str(tmp_path / "responses.sqlite")
+    )
+    agent_instance = StrandsAgent(mock_bedrock_model, config)
+    
+    agent_instance.run("Tell me a story")
+    agent_instance.run("Tell me a story")
+    
+    assert mock_strands_agent.call_count == 2
+
+
+def test_agent_run_streaming(agent):
+    """Test streaming yields text deltas as they arrive."""
+    async def fake_stream_async(user_input):
+        yield {"init_event_loop": True}
+        yield {"data": "Hello"}
+        yield {"data": ", world"}
+        yield {"result": Mock()}
+    
+    agent.agent.stream_async = fake_stream_async
+    
+    chunks = list(agent.run_streaming("Hi"))
+    
+    assert chunks == ["Hello", ", world"]
+
+
+def test_agent_run_streaming_error(agent):
+    """Test errors raised while streaming reach the caller."""
+    async def failing_stream_async(user_input):
+        yield {"data": "partial"}
+        raise RuntimeError("stream failed")
+    
+    agent.agent.stream_async = failing_stream_async
+    
+    stream = agent.run_streaming("Hi")
+    assert next(stream) == "partial"
+    with pytest.raises(RuntimeError, match="stream failed"):
+        next(stream)
+
+
+def test_agent_run_streaming_cancels_when_closed(agent, mock_agent_response):
+    """Test closing the stream early stops it and frees the agent for the next run."""
+    busy = False
+    produced = []
+    
+    async def slow_stream_async(user_input):
+        nonlocal busy
+        busy = True
+        try:
+            for i in range(20):
+                produced.append(i)
+                yield {"data": f"chunk {i}"}
+                await asyncio.sleep(0.05)
+        finally:
+            busy = False
+    
+    def run_agent(user_input):
+        if busy:
+            raise RuntimeError("Agent is already processing a request")
+        return mock_agent_response
+    
+    agent.agent.stream_async = slow_stream_async
+    agent.agent.side_effect = run_agent
+    
+    stream = agent.run_streaming("Hi")
+    assert next(stream) == "chunk 0"
+    stream.close()
+    
+    assert agent.run("next") == "Test response from agent"
+    assert len(produced) < 20
+
+
+def test_agent_arun(agent, mock_agent_response):
+    """Test async run returns the same response as run."""
+    agent.agent.return_value = mock_agent_response
+    
+    response = asyncio.run(agent.arun("Hello"))
+    
+    assert response == "Test response from agent"
+    agent.agent.assert_called_once_with("Hello")
+
+
+def test_agent_run_streaming_records_usage(agent):
+    """Test token usage is captured from stream metadata events."""
+    async def fake_stream_async(user_input):
+        yield {"data": "Hi"}
+        yield {"event": {"metadata": {"usage": {"inputTokens": 10, "outputTokens": 3, "totalTokens": 13}}}}
+        yield {"event": {"metadata": {"usage": {"inputTokens": 20, "outputTokens": 5, "totalTokens": 25}}}}
+    
+    agent.agent.stream_async = fake_stream_async
+    
+    assert agent.last_usage is None
+    list(agent.run_streaming("Hello"))
+    
+    assert agent.last_usage == {"prompt_tokens": 30, "completion_tokens": 8, "total_tokens": 38}
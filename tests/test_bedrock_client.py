@@ -3,10 +3,20 @@
 import pytest
 from unittest.mock import Mock, patch, MagicMock
 
-from agent_poc.bedrock_client import create_bedrock_model
+import strands.models
+
+from agent_poc.bedrock_client import _build_bedrock_model, create_bedrock_model
 from agent_poc.config.settings import AWSConfig, BedrockConfig
 
 
+@pytest.fixture(autouse=True)
+def clear_model_cache():
+    """Start each test with an empty model cache."""
+    _build_bedrock_model.cache_clear()
+    yield
+    _build_bedrock_model.cache_clear()
+
+
 @pytest.fixture
 def aws_config():
     """Create test AWS configuration."""
@@ -27,12 +37,12 @@ def bedrock_config():
     )
 
 
-@patch("agent_poc.bedrock_client.boto3")
-@patch("agent_poc.bedrock_client.BedrockModel")
-def test_create_bedrock_model(mock_bedrock_model_class, mock_boto3, aws_config, bedrock_config):
+@patch("boto3.Session")
+@patch("strands.models.BedrockModel")
+def test_create_bedrock_model(mock_bedrock_model_class, mock_session_class, aws_config, bedrock_config):
     """Test Bedrock model creation."""
     mock_session = Mock()
-    mock_boto3.Session.return_value = mock_session
+    mock_session_class.return_value = mock_session
     
     mock_model_instance = Mock()
     mock_bedrock_model_class.return_value = mock_model_instance
@@ -40,7 +50,7 @@ def test_create_bedrock_model(mock_bedrock_model_class, mock_boto3, aws_config,
     result = create_bedrock_model(aws_config, bedrock_config)
     
     # Verify boto3 session was created with correct parameters
-    mock_boto3.Session.assert_called_once_with(
+    mock_session_class.assert_called_once_with(
         region_name="us-east-1",
         aws_access_key_id="test-key",
         aws_secret_access_key="test-secret"
@@ -57,16 +67,16 @@ def test_create_bedrock_model(mock_bedrock_model_class, mock_boto3, aws_config,
     assert result == mock_model_instance
 
 
-@patch("agent_poc.bedrock_client.boto3")
-@patch("agent_poc.bedrock_client.BedrockModel")
+@patch("boto3.Session")
+@patch("strands.models.BedrockModel")
 def test_create_bedrock_model_without_credentials(
-    mock_bedrock_model_class, mock_boto3, bedrock_config
+    mock_bedrock_model_class, mock_session_class, bedrock_config
 ):
     """Test Bedrock model creation without explicit credentials."""
     aws_config = AWSConfig(aws_region="us-west-2")
     
     mock_session = Mock()
-    mock_boto3.Session.return_value = mock_session
+    mock_session_class.return_value = mock_session
     
     mock_model_instance = Mock()
     mock_bedrock_model_class.return_value = mock_model_instance
@@ -74,15 +84,15 @@ def test_create_bedrock_model_without_credentials(
     result = create_bedrock_model(aws_config, bedrock_config)
     
     # Verify session created with only region
-    mock_boto3.Session.assert_called_once_with(region_name="us-west-2")
+    mock_session_class.assert_called_once_with(region_name="us-west-2")
     
     assert result == mock_model_instance
 
 
-@patch("agent_poc.bedrock_client.boto3")
-@patch("agent_poc.bedrock_client.BedrockModel")
+@patch("boto3.Session")
+@patch("strands.models.BedrockModel")
 def test_create_bedrock_model_with_session_token(
-    mock_bedrock_model_class, mock_boto3, bedrock_config
+    mock_bedrock_model_class, mock_session_class, bedrock_config
 ):
     """Test Bedrock model creation with session token."""
     aws_config = AWSConfig(
@@ -93,7 +103,7 @@ def test_create_bedrock_model_with_session_token(
     )
     
     mock_session = Mock()
-    mock_boto3.Session.return_value = mock_session
+    mock_session_class.return_value = mock_session
     
     mock_model_instance = Mock()
     mock_bedrock_model_class.return_value = mock_model_instance
@@ -101,7 +111,7 @@ def test_create_bedrock_model_with_session_token(
     result = create_bedrock_model(aws_config, bedrock_config)
     
     # Verify session created with all credentials including token
-    mock_boto3.Session.assert_called_once_with(
+    mock_session_class.assert_called_once_with(
         region_name="eu-west-1",
         aws_access_key_id="test-key",
         aws_secret_access_key="test-secret",
@@ -109,3 +119,103 @@ def test_create_bedrock_model_with_session_token(
     )
     
     assert result == mock_model_instance
+
+
+@patch("boto3.Session")
+@patch("strands.models.BedrockModel")
+def test_create_bedrock_model_latency_optimized(mock_bedrock_model_class, mock_session_class):
+    """Test latency-optimized inference is requested for supported models."""
+    aws_config = AWSConfig(aws_region="us-east-2")
+    bedrock_config = BedrockConfig(bedrock_model_id="us.anthropic.claude-3-5-haiku-20241022-v1:0")
+    
+    create_bedrock_model(aws_config, bedrock_config)
+    
+    _, kwargs = mock_bedrock_model_class.call_args
+    assert kwargs["additional_args"] == {"performanceConfig": {"latency": "optimized"}}
+
+
+@patch("boto3.Session")
+@patch("strands.models.BedrockModel")
+def test_create_bedrock_model_latency_optimized_unsupported(mock_bedrock_model_class, mock_session_class):
+    """Test latency-optimized inference is skipped for unsupported models."""
+    aws_config = AWSConfig(aws_region="us-east-2")
+    bedrock_config = BedrockConfig(bedrock_model_id="amazon.nova-pro-v1:0")
+    
+    create_bedrock_model(aws_config, bedrock_config)
+    
+    _, kwargs = mock_bedrock_model_class.call_args
+    assert "additional_args" not in kwargs
+
+
+@pytest.mark.parametrize("model_id, region", [
+    ("us.anthropic.claude-3-5-sonnet-20241022-v2:0", "us-west-2"),
+    ("us.meta.llama3-1-405b-instruct-v1:0", "us-west-2"),
+])
+@patch("boto3.Session")
+@patch("strands.models.BedrockModel")
+def test_create_bedrock_model_latency_optimized_undocumented_pair(
+    mock_bedrock_model_class, mock_session_class, model_id, region
+):
+    """Test the field is only sent for documented model/region pairs."""
+    create_bedrock_model(AWSConfig(aws_region=region), BedrockConfig(bedrock_model_id=model_id))
+    
+    _, kwargs = mock_bedrock_model_class.call_args
+    assert "additional_args" not in kwargs
+
+
+@patch("boto3.Session")
+@patch("strands.models.BedrockModel")
+def test_create_bedrock_model_is_cached(mock_bedrock_model_class, mock_session_class, aws_config, bedrock_config):
+    """Test repeated calls with the same configuration reuse the model."""
+    first = create_bedrock_model(aws_config, bedrock_config)
+    second = create_bedrock_model(aws_config, bedrock_config)
+    
+    assert first is second
+    mock_session_class.assert_called_once()
+    mock_bedrock_model_class.assert_called_once()
+
+
+@patch("boto3.Session")
+@patch("strands.models.BedrockModel")
+def test_create_bedrock_model_prompt_cache(mock_bedrock_model_class, mock_session_class, aws_config):
+    """Test the system prompt is cached for models that support it."""
+    if not hasattr(strands.models, "CacheConfig"):
+        pytest.skip("installed strands-agents predates CacheConfig")
+    bedrock_config = BedrockConfig(bedrock_model_id="anthropic.claude-3-7-sonnet-20250219-v1:0")
+    
+    create_bedrock_model(aws_config, bedrock_config)
+    
+    _, kwargs = mock_bedrock_model_class.call_args
+    assert isinstance(kwargs["cache_config"], strands.models.CacheConfig)
+    assert "cache_prompt" not in kwargs
+
+
+@patch("boto3.Session")
+@patch("strands.models.BedrockModel")
+def test_create_bedrock_model_prompt_cache_without_cache_config(mock_bedrock_model_class, mock_session_class, aws_config):
+    """Test SDK releases without CacheConfig fall back to cache_prompt."""
+    bedrock_config = BedrockConfig(bedrock_model_id="anthropic.claude-3-7-sonnet-20250219-v1:0")
+    
+    with patch.dict(strands.models.__dict__):
+        strands.models.__dict__.pop("CacheConfig", None)
+        create_bedrock_model(aws_config, bedrock_config)
+    
+    _, kwargs = mock_bedrock_model_class.call_args
+    assert kwargs["cache_prompt"] == "default"
+    assert "cache_config" not in kwargs
+
+
+@patch("boto3.Session")
+@patch("strands.models.BedrockModel")
+def test_create_bedrock_model_prompt_cache_disabled(mock_bedrock_model_class, mock_session_class, aws_config):
+    """Test prompt caching can be turned off."""
+    bedrock_config = BedrockConfig(
+        bedrock_model_id="anthropic.claude-3-7-sonnet-20250219-v1:0",
+        bedrock_enable_prompt_cache=False
+    )
+    
+    create_bedrock_model(aws_config, bedrock_config)
+    
+    _, kwargs = mock_bedrock_model_class.call_args
+    assert "cache_prompt" not in kwargs
+    assert "cache_config" not in kwargs
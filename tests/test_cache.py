@@ -0,0 +1,68 @@
+"""Tests for the response cache."""
+
+import pytest
+
+from agent_poc.cache import ResponseCache, make_cache_key
+
+
+@pytest.fixture
+def cache(tmp_path):
+    """Create a response cache in a temporary directory."""
+    response_cache = ResponseCache(str(tmp_path / "responses.sqlite"))
+    yield response_cache
+    response_cache.close()
+
+
+def test_make_cache_key_is_stable():
+    """Test identical calls produce identical keys."""
+    key_a = make_cache_key("sys", [{"role": "user", "content": [{"text": "hi"}]}], "Hello", "model", 0.0)
+    key_b = make_cache_key("sys", [{"role": "user", "content": [{"text": "hi"}]}], "Hello", "model", 0.0)
+    assert key_a == key_b
+
+
+def test_make_cache_key_varies_with_inputs():
+    """Test any change in the call produces a different key."""
+    base = make_cache_key("sys", [], "Hello", "model", 0.0)
+    assert make_cache_key("other", [], "Hello", "model", 0.0) != base
+    assert make_cache_key("sys", [{"role": "user"}], "Hello", "model", 0.0) != base
+    assert make_cache_key("sys", [], "Bye", "model", 0.0) != base
+    assert make_cache_key("sys", [], "Hello", "other-model", 0.0) != base
+    assert make_cache_key("sys", [], "Hello", "model", 0.1) != base
+
+
+def test_cache_set_and_get(cache):
+    """Test stored responses can be retrieved."""
+    cache.set("key", "cached response")
+    assert cache.get("key") == "cached response"
+
+
+def test_cache_miss(cache):
+    """Test missing keys return None."""
+    assert cache.get("missing") is None
+
+
+def test_cache_expired_entry(tmp_path):
+    """Test entries older than the TTL are ignored."""
+    response_cache = ResponseCache(str(tmp_path / "responses.sqlite"), ttl_seconds=-1)
+    response_cache.set("key", "stale response")
+    assert response_cache.get("key") is None
+    response_cache.close()
+
+
+def test_cache_persists_across_instances(tmp_path):
+    """Test entries survive reopening the database."""
+    path = str(tmp_path / "responses.sqlite")
+    first = ResponseCache(path)
+    first.set("key", "persisted response")
+    first.close()
+    
+    second = ResponseCache(path)
+    assert second.get("key") == "persisted response"
+    second.close()
+
+
+def test_make_cache_key_handles_non_json_content():
+    """Test history containing non-JSON values (e.g. image bytes) can be keyed."""
+    messages = [{"role": "user", "content": [{"image": {"source": {"bytes": b"\x89PNG"}}}]}]
+    key = make_cache_key("sys", messages, "Describe this", "model", 0.0)
+    assert key == make_cache_key("sys", messages, "Describe this", "model", 0.0)
@@ -0,0 +1,294 @@
+"""Tests for the OpenAI model wrapper."""
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from agent_poc.openai_client import (
+    OpenAIModel,
+    _RESPONSE_CACHE,
+    _get_openai_client,
+)
+
+
+def make_chunk(text, finish_reason=None):
+    """Build a minimal ChatCompletionChunk-like object."""
+    delta = SimpleNamespace(content=text)
+    return SimpleNamespace(choices=[SimpleNamespace(delta=delta, finish_reason=finish_reason)])
+
+
+async def async_iter(items):
+    """Yield items from an async iterator."""
+    for item in items:
+        yield item
+
+
+async def collect(async_iterable):
+    """Collect all events from an async iterable."""
+    return [event async for event in async_iterable]
+
+
+def make_async_client(create):
+    """Build a fake AsyncOpenAI client whose completions call is ``create``."""
+    client = Mock()
+    client.chat.completions.create = create
+    client.close = AsyncMock()
+    return client
+
+
+@pytest.fixture(autouse=True)
+def clear_client_cache():
+    """Start each test with empty client and response caches."""
+    _get_openai_client.cache_clear()
+    _RESPONSE_CACHE.clear()
+    yield
+    _get_openai_client.cache_clear()
+    _RESPONSE_CACHE.clear()
+
+
+def test_models_share_pooled_client():
+    """Test models with the same API key reuse one HTTP client."""
+    first = OpenAIModel(model="gpt-4o", api_key="sk-test")
+    second = OpenAIModel(model="gpt-4o-mini", api_key="sk-test")
+    
+    assert first.client is second.client
+
+
+def test_models_with_different_keys_use_separate_clients():
+    """Test clients are not shared across API keys."""
+    first = OpenAIModel(model="gpt-4o", api_key="sk-test-1")
+    second = OpenAIModel(model="gpt-4o", api_key="sk-test-2")
+    
+    assert first.client is not second.client
+
+
+def test_stream_closes_async_client():
+    """Test stream releases its per-call async client when it finishes."""
+    model = OpenAIModel(model="gpt-4o", api_key="sk-test")
+    client = make_async_client(AsyncMock(return_value=async_iter([make_chunk("Hi", "stop")])))
+    
+    with patch("agent_poc.openai_client._create_async_openai_client", return_value=client):
+        asyncio.run(collect(model.stream([{"role": "user", "content": "Hi"}])))
+    
+    client.close.assert_awaited_once()
+
+
+def test_stream_closes_async_client_when_abandoned():
+    """Test the async client is also closed if the consumer stops early."""
+    model = OpenAIModel(model="gpt-4o", api_key="sk-test")
+    client = make_async_client(AsyncMock(return_value=async_iter([make_chunk("a"), make_chunk("b", "stop")])))
+    
+    async def consume_first_delta():
+        stream = model.stream([{"role": "user", "content": "Hi"}], stream_buffer_bytes=1)
+        async for event in stream:
+            if "contentBlockDelta" in event:
+                break
+        await stream.aclose()
+    
+    with patch("agent_poc.openai_client._create_async_openai_client", return_value=client):
+        asyncio.run(consume_first_delta())
+    
+    client.close.assert_awaited_once()
+
+
+def test_stream_uses_async_client():
+    """Test stream awaits the async client and yields text deltas."""
+    model = OpenAIModel(model="gpt-4o", api_key="sk-test")
+    mock_async_client = make_async_client(AsyncMock(
+        return_value=async_iter([make_chunk("Hello"), make_chunk(None), make_chunk(" world", "stop")])
+    ))
+    
+    with patch("agent_poc.openai_client._create_async_openai_client", return_value=mock_async_client):
+        events = asyncio.run(collect(model.stream([{"role": "user", "content": "Hi"}])))
+    
+    text = "".join(
+        event["contentBlockDelta"]["delta"]["text"] for event in events if "contentBlockDelta" in event
+    )
+    assert text == "Hello world"
+    assert events[:2] == [
+        {"messageStart": {"role": "assistant"}},
+        {"contentBlockStart": {"start": {"toolUse": None}, "contentBlockIndex": 0}},
+    ]
+    assert events[-2:] == [
+        {"contentBlockStop": {"contentBlockIndex": 0}},
+        {"messageStop": {"stopReason": "end_turn", "additionalModelResponseFields": None}},
+    ]
+    _, kwargs = mock_async_client.chat.completions.create.call_args
+    assert kwargs["stream"] is True
+
+
+def make_completion(text):
+    """Build a minimal ChatCompletion-like object."""
+    return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=text))])
+
+
+def test_generate_many_preserves_order_and_limits_concurrency():
+    """Test batched generation returns responses in order within the concurrency bound."""
+    model = OpenAIModel(model="gpt-4o", api_key="sk-test")
+    in_flight = 0
+    max_in_flight = 0
+    
+    async def fake_create(**kwargs):
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return make_completion(f"echo: {kwargs['messages'][0]['content']}")
+    
+    mock_async_client = make_async_client(fake_create)
+    batch = [[{"role": "user", "content": str(i)}] for i in range(5)]
+    
+    with patch("agent_poc.openai_client._create_async_openai_client", return_value=mock_async_client):
+        responses = model.generate_many(batch, concurrency=2)
+    
+    assert responses == [f"echo: {i}" for i in range(5)]
+    assert max_in_flight == 2
+    mock_async_client.close.assert_awaited_once()
+
+
+def stream_deltas(model, chunks, **kwargs):
+    """Run stream over fake chunks and return the emitted text deltas."""
+    mock_async_client = make_async_client(AsyncMock(return_value=async_iter(chunks)))
+    with patch("agent_poc.openai_client._create_async_openai_client", return_value=mock_async_client):
+        events = asyncio.run(collect(model.stream([{"role": "user", "content": "Hi"}], **kwargs)))
+    return [event["contentBlockDelta"]["delta"]["text"] for event in events if "contentBlockDelta" in event]
+
+
+def test_stream_coalesces_deltas():
+    """Test the first delta is emitted at once and later ones are merged."""
+    model = OpenAIModel(model="gpt-4o", api_key="sk-test")
+    chunks = [make_chunk("a"), make_chunk("b"), make_chunk("c"), make_chunk(None, "stop")]
+    
+    deltas = stream_deltas(model, chunks, stream_flush_ms=60_000)
+    
+    assert deltas == ["a", "bc"]
+
+
+def test_stream_flushes_while_source_is_paused():
+    """Test buffered text is emitted on time even when no new chunk arrives."""
+    model = OpenAIModel(model="gpt-4o", api_key="sk-test")
+    
+    async def paused_source():
+        yield make_chunk("Hello")
+        yield make_chunk(",")
+        await asyncio.sleep(0.5)
+        yield make_chunk(" world", "stop")
+    
+    client = make_async_client(AsyncMock(return_value=paused_source()))
+    
+    async def timed_deltas():
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        return [
+            (event["contentBlockDelta"]["delta"]["text"], loop.time() - start)
+            async for event in model.stream([{"role": "user", "content": "Hi"}], stream_flush_ms=20)
+            if "contentBlockDelta" in event
+        ]
+    
+    with patch("agent_poc.openai_client._create_async_openai_client", return_value=client):
+        deltas = asyncio.run(timed_deltas())
+    
+    assert [text for text, _ in deltas] == ["Hello", ",", " world"]
+    assert deltas[0][1] < 0.1
+    assert deltas[1][1] < 0.25
+
+
+def test_stream_flushes_at_buffer_limit():
+    """Test a delta is emitted as soon as the buffer limit is reached."""
+    model = OpenAIModel(model="gpt-4o", api_key="sk-test")
+    chunks = [make_chunk("ab"), make_chunk("cd"), make_chunk("e", "stop")]
+    
+    deltas = stream_deltas(model, chunks, stream_buffer_bytes=2, stream_flush_ms=60_000)
+    
+    assert deltas == ["ab", "cd", "e"]
+
+
+def test_format_messages_with_system_handles_dict_messages():
+    """Test Strands dict messages get typed text blocks after the system prompt."""
+    model = OpenAIModel(model="gpt-4o", api_key="sk-test")
+    messages = [{"role": "user", "content": [{"text": "Hello"}, "world"]}]
+    
+    formatted = model._format_messages_with_system(messages, system_prompt="Be brief.")
+    
+    assert formatted == [
+        {"role": "system", "content": "Be brief."},
+        {"role": "user", "content": [{"text": "Hello", "type": "text"}, {"type": "text", "text": "world"}]},
+    ]
+
+
+def test_format_messages_with_system_handles_message_objects():
+    """Test attribute-style messages are simplified and unknown values fall back to text."""
+    model = OpenAIModel(model="gpt-4o", api_key="sk-test")
+    messages = [
+        SimpleNamespace(role="assistant", content=[SimpleNamespace(text="Hi")]),
+        SimpleNamespace(role="user", content="plain"),
+        42,
+    ]
+    
+    formatted = model._format_messages_with_system(messages)
+    
+    assert formatted == [
+        {"role": "assistant", "content": "Hi"},
+        {"role": "user", "content": "plain"},
+        {"role": "user", "content": "42"},
+    ]
+
+
+def test_generate_caches_deterministic_responses():
+    """Test identical temperature 0 calls are answered from the response cache."""
+    model = OpenAIModel(model="gpt-4o", api_key="sk-test", temperature=0)
+    messages = [{"role": "user", "content": "Hi"}]
+    
+    with patch.object(model.client.chat.completions, "create", return_value=make_completion("Hello")) as create:
+        assert model.generate(messages) == "Hello"
+        assert model.generate(messages) == "Hello"
+        model.generate([{"role": "user", "content": "Other"}])
+    
+    assert create.call_count == 2
+
+
+def test_generate_cache_opt_out_and_sampling():
+    """Test no_cache and non-zero temperatures always call the API."""
+    model = OpenAIModel(model="gpt-4o", api_key="sk-test", temperature=0)
+    messages = [{"role": "user", "content": "Hi"}]
+    
+    with patch.object(model.client.chat.completions, "create", return_value=make_completion("Hello")) as create:
+        model.generate(messages, no_cache=True)
+        model.generate(messages, no_cache=True)
+        model.generate(messages, temperature=0.7)
+        model.generate(messages, temperature=0.7)
+    
+    assert create.call_count == 4
+    assert "no_cache" not in create.call_args.kwargs
+
+
+def test_generate_cache_evicts_least_recently_used():
+    """Test the response cache stays within its size limit."""
+    model = OpenAIModel(model="gpt-4o", api_key="sk-test", temperature=0)
+    
+    with patch("agent_poc.openai_client.RESPONSE_CACHE_SIZE", 2), \
+            patch.object(model.client.chat.completions, "create", return_value=make_completion("Hello")) as create:
+        for text in ["a", "b", "a", "c", "a", "b"]:
+            model.generate([{"role": "user", "content": text}])
+    
+    # "b" was evicted by "c", so only the first "a", "b", "c" and the final "b" miss
+    assert create.call_count == 4
+    assert len(_RESPONSE_CACHE) == 2
+
+
+def test_structured_output_passes_system_prompt_to_generate():
+    """Test structured output sends the system prompt ahead of the messages."""
+    model = OpenAIModel(model="gpt-4o", api_key="sk-test")
+    messages = [{"role": "user", "content": "Hi"}]
+    
+    with patch.object(model.client.chat.completions, "create", return_value=make_completion("Hello")) as create:
+        result = model.structured_output(messages, schema={}, system_prompt="Be brief.")
+    
+    assert result == {"response": "Hello"}
+    assert create.call_args.kwargs["messages"] == [
+        {"role": "system", "content": "Be brief."},
+        {"role": "user", "content": "Hi"},
+    ]
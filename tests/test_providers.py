@@ -0,0 +1,41 @@
+"""Tests for the model provider registry."""
+
+import pytest
+from unittest.mock import Mock, patch
+
+from agent_poc.config.settings import AgentConfig, Settings
+from agent_poc.providers import create_model
+
+
+@patch("agent_poc.openai_client.create_openai_model")
+def test_create_model_openai(mock_create_openai_model):
+    """Test the OpenAI provider builds an OpenAI model."""
+    settings = Settings(agent=AgentConfig(agent_provider="openai"))
+    mock_model = Mock()
+    mock_create_openai_model.return_value = mock_model
+    
+    result = create_model(settings)
+    
+    mock_create_openai_model.assert_called_once_with(settings.openai)
+    assert result == mock_model
+
+
+@patch("agent_poc.bedrock_client.create_bedrock_model")
+def test_create_model_bedrock(mock_create_bedrock_model):
+    """Test the Bedrock provider builds a Bedrock model."""
+    settings = Settings(agent=AgentConfig(agent_provider="bedrock"))
+    mock_model = Mock()
+    mock_create_bedrock_model.return_value = mock_model
+    
+    result = create_model(settings)
+    
+    mock_create_bedrock_model.assert_called_once_with(settings.aws, settings.bedrock)
+    assert result == mock_model
+
+
+def test_create_model_unknown_provider():
+    """Test unsupported providers are rejected."""
+    settings = Settings(agent=AgentConfig(agent_provider="unknown"))
+    
+    with pytest.raises(ValueError, match="Unsupported agent provider"):
+        create_model(settings)
@@ -17,6 +17,8 @@ def test_bedrock_config_defaults():
     assert config.bedrock_model_id == "anthropic.claude-3-sonnet-20240229-v1:0"
     assert config.bedrock_max_tokens == 4096
     assert config.bedrock_temperature == 0.7
+    assert config.bedrock_latency_optimized is True
+    assert config.bedrock_enable_prompt_cache is True
 
 
 def test_agent_config_defaults():
@@ -38,3 +40,17 @@ def test_get_settings():
     """Test get_settings factory function."""
     settings = get_settings()
     assert isinstance(settings, Settings)
+
+
+def test_get_settings_is_cached():
+    """Test get_settings returns the same instance on repeated calls."""
+    assert get_settings() is get_settings()
+
+
+def test_settings_read_environment(monkeypatch):
+    """Test sub-configs pick up values from the environment."""
+    monkeypatch.setenv("AWS_REGION", "eu-west-1")
+    monkeypatch.setenv("AGENT_PROVIDER", "bedrock")
+    settings = Settings()
+    assert settings.aws.aws_region == "eu-west-1"
+    assert settings.agent.agent_provider == "bedrock"
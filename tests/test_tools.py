@@ -1,7 +1,22 @@
 """Tests for agent tools."""
 
+import asyncio
+import threading
+import time
+
 import pytest
-from agent_poc.tools import get_current_time, calculate, search_knowledge_base
+from unittest.mock import Mock, patch
+
+from agent_poc.tools import (
+    _default_query_kb_tool,
+    _get_bedrock_runtime,
+    calculate,
+    get_current_time,
+    make_query_kb_tool,
+    query_bedrock_knowledge_base,
+    query_bedrock_knowledge_base_many,
+    search_knowledge_base,
+)
 
 
 def test_get_current_time():
@@ -12,6 +27,20 @@ def test_get_current_time():
     assert "T" in result
 
 
+@patch("agent_poc.tools._LAST_TIME", (0.0, ""))
+@patch("agent_poc.tools._now")
+def test_get_current_time_reuses_value_within_a_second(mock_now):
+    """Test the formatted time is cached for up to one second."""
+    mock_now.side_effect = [1_000.0, 1_000.5, 1_001.2]
+    
+    first = get_current_time()
+    second = get_current_time()
+    third = get_current_time()
+    
+    assert first == second
+    assert third != first
+
+
 def test_calculate_simple():
     """Test simple calculation."""
     result = calculate("2 + 2")
@@ -49,3 +78,184 @@ def test_search_knowledge_base():
     assert isinstance(result, str)
     assert "test query" in result
     assert "placeholder" in result.lower()
+
+
+@patch("boto3.Session")
+def test_bedrock_runtime_client_is_cached(mock_session):
+    """Test the Bedrock Agent Runtime client is built once per credential set."""
+    _get_bedrock_runtime.cache_clear()
+    
+    first = _get_bedrock_runtime("us-east-1", "key", "secret", None)
+    second = _get_bedrock_runtime("us-east-1", "key", "secret", None)
+    
+    assert first is second
+    mock_session.assert_called_once_with(
+        aws_access_key_id="key",
+        aws_secret_access_key="secret",
+        aws_session_token=None,
+        region_name="us-east-1"
+    )
+    _get_bedrock_runtime.cache_clear()
+
+
+def test_calculate_unary_and_precedence():
+    """Test unary operators and operator precedence."""
+    assert calculate("-3 + 2 * 4") == "5"
+    assert calculate("2 ** 3") == "8"
+
+
+def test_calculate_ignores_surrounding_whitespace():
+    """Test expressions with leading or trailing spaces still evaluate."""
+    assert calculate(" 2+2") == "4"
+    assert calculate("  (1 + 2) * 3  ") == "9"
+
+
+def test_calculate_bounds_exponentiation():
+    """Test runaway exponents are rejected instead of evaluated."""
+    result = calculate("9**9**8")
+    assert "Error" in result
+    assert "too large" in result
+    assert "Error" in calculate("(9**100)**2")
+
+
+def test_calculate_rejects_non_arithmetic():
+    """Test that expressions other than arithmetic are rejected."""
+    result = calculate("()")
+    assert "Error" in result
+
+
+def test_calculate_syntax_error():
+    """Test calculation with a malformed expression."""
+    result = calculate("2 +")
+    assert "Error" in result
+
+
+@patch("agent_poc.tools._get_bedrock_runtime")
+def test_query_kb_tool_formats_results(mock_get_runtime):
+    """Test knowledge base results are formatted one after another."""
+    settings = Mock()
+    settings.bedrock_kb.bedrock_kb_id = "kb-123"
+    mock_get_runtime.return_value.retrieve.return_value = {
+        "retrievalResults": [
+            {
+                "content": {"text": "First"},
+                "score": 0.9,
+                "location": {"type": "S3", "s3Location": {"uri": "bucket/a.txt"}},
+            },
+            {"content": {"text": "Second"}, "score": 0.5},
+        ]
+    }
+    tool = make_query_kb_tool(settings)
+    
+    result = tool("test query", max_results=2)
+    
+    assert result == (
+        "Knowledge Base Search Results for 'test query':\n\n"
+        "Result 1 (relevance: 0.90):\nFirst\nSource: s3://bucket/a.txt\n"
+        "\n"
+        "Result 2 (relevance: 0.50):\nSecond\n\n"
+    )
+
+
+@patch("agent_poc.tools._get_bedrock_runtime")
+def test_query_kb_tool_binds_client_once(mock_get_runtime):
+    """Test the tool resolves its client on the first call, not on every call."""
+    settings = Mock()
+    settings.bedrock_kb.bedrock_kb_id = "kb-123"
+    mock_get_runtime.return_value.retrieve.return_value = {"retrievalResults": []}
+    tool = make_query_kb_tool(settings)
+    mock_get_runtime.assert_not_called()
+    
+    tool("first")
+    tool("second")
+    
+    mock_get_runtime.assert_called_once()
+    assert mock_get_runtime.return_value.retrieve.call_count == 2
+    assert mock_get_runtime.return_value.retrieve.call_args.kwargs["knowledgeBaseId"] == "kb-123"
+
+
+@patch("agent_poc.tools._get_bedrock_runtime")
+def test_query_kb_tool_requires_kb_id(mock_get_runtime):
+    """Test the tool reports a missing knowledge base ID without creating a client."""
+    settings = Mock()
+    settings.bedrock_kb.bedrock_kb_id = None
+    
+    result = make_query_kb_tool(settings)("test query")
+    
+    assert "not configured" in result
+    mock_get_runtime.assert_not_called()
+
+
+@patch("agent_poc.tools._get_bedrock_runtime")
+def test_query_kb_tool_reports_client_errors(mock_get_runtime):
+    """Test a client that cannot be created is reported by the tool and retried."""
+    settings = Mock()
+    settings.bedrock_kb.bedrock_kb_id = "kb-123"
+    client = Mock()
+    client.retrieve.return_value = {"retrievalResults": []}
+    mock_get_runtime.side_effect = [RuntimeError("no region"), client]
+    tool = make_query_kb_tool(settings)
+    
+    assert tool("test query") == "Error querying knowledge base: no region"
+    assert tool("test query") == "No results found in the knowledge base for query: 'test query'"
+    assert mock_get_runtime.call_count == 2
+
+
+@patch("agent_poc.tools.make_query_kb_tool")
+def test_query_bedrock_knowledge_base_uses_default_tool(mock_make_tool):
+    """Test the module-level tool reuses one tool built from the default settings."""
+    _default_query_kb_tool.cache_clear()
+    mock_make_tool.return_value.return_value = "results"
+    
+    assert query_bedrock_knowledge_base("first") == "results"
+    assert query_bedrock_knowledge_base("second", max_results=2) == "results"
+    
+    mock_make_tool.assert_called_once_with()
+    mock_make_tool.return_value.assert_called_with("second", 2)
+    _default_query_kb_tool.cache_clear()
+
+
+@patch("agent_poc.tools._get_bedrock_runtime")
+def test_query_bedrock_knowledge_base_many_runs_queries_concurrently(mock_get_runtime):
+    """Test batched KB queries overlap and keep their order."""
+    settings = Mock()
+    settings.bedrock_kb.bedrock_kb_id = "kb-123"
+    in_flight = 0
+    max_in_flight = 0
+    lock = threading.Lock()
+    
+    def fake_retrieve(**kwargs):
+        nonlocal in_flight, max_in_flight
+        with lock:
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+        time.sleep(0.05)
+        with lock:
+            in_flight -= 1
+        return {"retrievalResults": [{"content": {"text": kwargs["retrievalQuery"]["text"]}, "score": 1.0}]}
+    
+    mock_get_runtime.return_value.retrieve.side_effect = fake_retrieve
+    queries = ["a", "b", "c", "d"]
+    
+    results = asyncio.run(query_bedrock_knowledge_base_many(queries, settings=settings, concurrency=2))
+    
+    assert [result.splitlines()[3] for result in results] == queries
+    assert max_in_flight == 2
+    mock_get_runtime.assert_called_once()
+
+
+@pytest.mark.parametrize("level, expect_traceback", [("INFO", False), ("DEBUG", True)])
+@patch("agent_poc.tools._get_bedrock_runtime")
+def test_query_kb_tool_logs_traceback_only_when_debugging(mock_get_runtime, caplog, level, expect_traceback):
+    """Test unexpected errors include a traceback only at DEBUG level."""
+    settings = Mock()
+    settings.bedrock_kb.bedrock_kb_id = "kb-123"
+    mock_get_runtime.return_value.retrieve.side_effect = RuntimeError("boom")
+    caplog.set_level(level, logger="agent_poc.tools")
+    
+    result = make_query_kb_tool(settings)("test query")
+    
+    assert result == "Error querying knowledge base: boom"
+    record = next(r for r in caplog.records if r.levelname == "ERROR")
+    assert record.getMessage() == "Error querying knowledge base: boom"
+    assert bool(record.exc_info) is expect_traceback